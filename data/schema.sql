@@ -25,7 +25,10 @@ CREATE TABLE IF NOT EXISTS signals (
     status TEXT NOT NULL DEFAULT 'new'      -- new, validated, scored, published, archived
 );
 
-CREATE INDEX IF NOT EXISTS idx_signals_status ON signals(status);
+-- (status, collected_at) serves get_signals_by_status' filter and ORDER BY;
+-- it supersedes the old single-column status index.
+DROP INDEX IF EXISTS idx_signals_status;
+CREATE INDEX IF NOT EXISTS idx_signals_status_collected ON signals(status, collected_at DESC);
 CREATE INDEX IF NOT EXISTS idx_signals_collected ON signals(collected_at);
 CREATE INDEX IF NOT EXISTS idx_signals_source ON signals(source_id);
 
@@ -132,6 +135,23 @@ CREATE TABLE IF NOT EXISTS delivery_log (
 CREATE INDEX IF NOT EXISTS idx_delivery_digest ON delivery_log(digest_id);
 CREATE INDEX IF NOT EXISTS idx_delivery_status ON delivery_log(status);
 
+-- ============================================================
+-- Delivery retry queue (sends waiting out a backoff)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS delivery_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipient_email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    html_path TEXT NOT NULL,               -- rendered digest on disk, shared by all rows
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_retry_at DATETIME NOT NULL DEFAULT (datetime('now')),
+    status TEXT NOT NULL DEFAULT 'pending', -- pending, sending, sent, failed
+    last_error TEXT,
+    created_at DATETIME NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_delivery_queue_due ON delivery_queue(status, next_retry_at);
+
 -- ============================================================
 -- Feedback from recipients (thumbs up/down on signals)
 -- ============================================================
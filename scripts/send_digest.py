@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import DELIVERY_MODE, MOCK_OUTPUT_DIR, get_recipients
-from src.delivery.gmail import send_email
+from src.delivery.gmail import close_smtp, send_email
 
 logging.basicConfig(
     level=logging.INFO,
@@ -61,6 +61,7 @@ def main():
         )
         results.append(result)
         logger.info("  Result: %s (mode: %s)", result["status"], result.get("mode", "unknown"))
+    close_smtp()
 
     sent = sum(1 for r in results if r["status"] == "sent")
     logger.info("Sent %d/%d emails successfully", sent, len(results))
@@ -7,19 +7,63 @@ and structured JSON response parsing for signal analysis.
 import json
 import logging
 import os
+import threading
 import time
 
 import anthropic
 
+from src.concurrency import TokenBucket
 from src.config import (
     ANTHROPIC_API_KEY,
     ANTHROPIC_MAX_TOKENS,
     ANTHROPIC_MODEL,
+    ANTHROPIC_RPM,
     ANTHROPIC_TEMPERATURE,
+    ANTHROPIC_TPM,
 )
 
 logger = logging.getLogger(__name__)
 
+# Message Batches jobs: status poll interval and overall wait (seconds)
+BATCH_POLL_SECONDS = 20
+BATCH_TIMEOUT_SECONDS = 3600
+
+# Rough chars-per-token ratio for estimating a request's input tokens
+CHARS_PER_TOKEN = 4
+
+# Process-wide rate limiters (limits are per account, not per client)
+_request_bucket: TokenBucket | None = None
+_token_bucket: TokenBucket | None = None
+_rate_limit_lock = threading.Lock()
+
+
+def _throttle(system_prompt: str, user_prompt: str) -> None:
+    """Wait until a request fits the configured RPM / TPM budgets."""
+    request_bucket, token_bucket = _request_bucket, _token_bucket
+    if request_bucket is not None:
+        waited = request_bucket.acquire()
+        if waited:
+            logger.debug("Throttled %.1fs for the request budget", waited)
+    if token_bucket is not None:
+        estimate = (len(system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN
+        waited = token_bucket.acquire(estimate)
+        if waited:
+            logger.debug("Throttled %.1fs for the token budget", waited)
+
+
+def reset_rate_limits() -> None:
+    """Rebuild the rate limiters from ANTHROPIC_RPM / ANTHROPIC_TPM.
+
+    Called at import; call again in tests or after a config change.
+    """
+    global _request_bucket, _token_bucket
+    with _rate_limit_lock:
+        _request_bucket = TokenBucket(ANTHROPIC_RPM) if ANTHROPIC_RPM > 0 else None
+        _token_bucket = TokenBucket(ANTHROPIC_TPM) if ANTHROPIC_TPM > 0 else None
+
+
+reset_rate_limits()
+
 
 def _read_auth_token() -> str | None:
     """Read a Bearer auth token from CLAUDE_SESSION_INGRESS_TOKEN_FILE if available."""
@@ -72,6 +116,10 @@ class AnalysisClient:
     ) -> dict | None:
         """Send a prompt to the Anthropic API and parse JSON response.
 
+        Each attempt first waits for room in the ANTHROPIC_RPM / ANTHROPIC_TPM
+        budgets, shared by all threads, so concurrent scoring is paced
+        client-side rather than by 429 responses.
+
         Args:
             system_prompt: System-level context for the model.
             user_prompt: The signal analysis request.
@@ -85,6 +133,7 @@ class AnalysisClient:
             return None
 
         for attempt in range(max_retries):
+            _throttle(system_prompt, user_prompt)
             try:
                 response = self._client.messages.create(
                     model=self.model,
@@ -121,6 +170,71 @@ class AnalysisClient:
         logger.error("All %d retry attempts exhausted", max_retries)
         return None
 
+    def analyze_batch_job(
+        self,
+        system_prompt: str,
+        user_prompts: list[str],
+        poll_seconds: float = BATCH_POLL_SECONDS,
+        timeout: float = BATCH_TIMEOUT_SECONDS,
+    ) -> list[dict | None] | None:
+        """Run many prompts as one Message Batches job (half the per-token cost).
+
+        Submits every prompt in a single batch, polls until processing has
+        ended, then parses each result like analyze().
+
+        Args:
+            system_prompt: System-level context shared by every request.
+            user_prompts: One user prompt per request.
+            poll_seconds: Interval between status checks.
+            timeout: Give up (and cancel the job) after this many seconds.
+
+        Returns:
+            Parsed JSON (or None for an errored request) per prompt, in input
+            order; None if the job could not be run at all.
+        """
+        if not self.available or not user_prompts:
+            return None
+
+        params = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": system_prompt,
+        }
+        try:
+            batch = self._client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": str(i),
+                        "params": {**params, "messages": [{"role": "user", "content": prompt}]},
+                    }
+                    for i, prompt in enumerate(user_prompts)
+                ]
+            )
+            logger.info("Submitted message batch %s (%d requests)", batch.id, len(user_prompts))
+
+            deadline = time.monotonic() + timeout
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    logger.error("Message batch %s timed out; cancelling", batch.id)
+                    self._client.messages.batches.cancel(batch.id)
+                    return None
+                time.sleep(poll_seconds)
+                batch = self._client.messages.batches.retrieve(batch.id)
+
+            results: list[dict | None] = [None] * len(user_prompts)
+            for entry in self._client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    text = entry.result.message.content[0].text
+                    results[int(entry.custom_id)] = self._parse_json_response(text)
+                else:
+                    logger.warning("Batch request %s %s", entry.custom_id, entry.result.type)
+            return results
+
+        except anthropic.APIError as e:
+            logger.error("Message batch failed: %s", e)
+            return None
+
     @staticmethod
     def _parse_json_response(text: str) -> dict | None:
         """Extract and parse JSON from the model response text.
@@ -265,7 +265,11 @@ def score_batch_ai(signals: list[dict], client: AnalysisClient | None = None) ->
     user_prompt = build_batch_prompt(signals)
 
     raw_result = client.analyze(system_prompt, user_prompt)
+    return _batch_results(signals, raw_result, client)
 
+
+def _batch_results(signals: list[dict], raw_result, client: AnalysisClient) -> list[dict]:
+    """Validate a batch response, scoring individually whatever is unusable."""
     if raw_result is None or not isinstance(raw_result, list):
         logger.warning("Batch analysis failed, falling back to individual scoring")
         return [score_signal(s, client) for s in signals]
@@ -293,3 +297,34 @@ def score_batch_ai(signals: list[dict], client: AnalysisClient | None = None) ->
         results.append(validated)
 
     return results
+
+
+def score_all_batch_api(
+    signals: list[dict], client: AnalysisClient | None = None, batch_size: int = 10
+) -> list[dict] | None:
+    """Score all signals in one Anthropic Message Batches job.
+
+    Signals are grouped into batch prompts of batch_size (as in
+    score_batch_ai) and the prompts are submitted together, at half the
+    per-token cost of synchronous calls, in exchange for asynchronous
+    completion. Suited to scheduled digest runs, not on-demand ones.
+
+    Returns:
+        Analysis result dicts in input order, or None if the job could not
+        be run (callers fall back to synchronous scoring).
+    """
+    client = client or _get_client()
+    if not client.available or not signals:
+        return None
+
+    groups = [signals[i:i + batch_size] for i in range(0, len(signals), batch_size)]
+    raw_results = client.analyze_batch_job(
+        build_system_prompt(), [build_batch_prompt(group) for group in groups]
+    )
+    if raw_results is None:
+        return None
+
+    results = []
+    for group, raw in zip(groups, raw_results):
+        results.extend(_batch_results(group, raw, client))
+    return results
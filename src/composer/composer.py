@@ -4,17 +4,24 @@ Generates responsive HTML email digests from scored signals.
 """
 
 import base64
+import hashlib
 import io
 import logging
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
 
-from jinja2 import Environment, FileSystemLoader
+import orjson
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from markupsafe import Markup, escape
 from PIL import Image
 
-from src.config import CONFIG_DIR, TEMPLATES_DIR
+from src.config import CACHE_DIR, CONFIG_DIR, TEMPLATES_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -22,53 +29,114 @@ logger = logging.getLogger(__name__)
 HEADER_LOGO_WIDTH = 220
 BU_LOGO_HEIGHT = 34
 
+# Logos are decoded/encoded on a small thread pool (see _process_logos)
+LOGO_WORKERS = 4
+_HEADER_LOGO_KEY = "__header__"
+
+
+class SignalTypeStyle(NamedTuple):
+    """Badge colors and icon for a signal type."""
+
+    color: str
+    bg: str
+    icon: str
+
+
 # Signal type color scheme — professional, blue-centric, no orange/yellow
 SIGNAL_TYPE_COLORS = {
-    "competitive-threat": {"color": "#B71C1C", "bg": "#FDE8E8", "icon": "\u26a0"},
-    "revenue-opportunity": {"color": "#1B5E20", "bg": "#E6F4EA", "icon": "\U0001f4b0"},
-    "market-shift": {"color": "#0D47A1", "bg": "#E3F2FD", "icon": "\U0001f3af"},
-    "partnership-signal": {"color": "#006064", "bg": "#E0F2F1", "icon": "\U0001f91d"},
-    "customer-intelligence": {"color": "#4A148C", "bg": "#F3E5F5", "icon": "\U0001f4ca"},
-    "technology-trend": {"color": "#01579B", "bg": "#E1F5FE", "icon": "\U0001f680"},
-    "trade-tariff": {"color": "#263238", "bg": "#ECEFF1", "icon": "\U0001f30d"},
+    "competitive-threat": SignalTypeStyle("#B71C1C", "#FDE8E8", "\u26a0"),
+    "revenue-opportunity": SignalTypeStyle("#1B5E20", "#E6F4EA", "\U0001f4b0"),
+    "market-shift": SignalTypeStyle("#0D47A1", "#E3F2FD", "\U0001f3af"),
+    "partnership-signal": SignalTypeStyle("#006064", "#E0F2F1", "\U0001f91d"),
+    "customer-intelligence": SignalTypeStyle("#4A148C", "#F3E5F5", "\U0001f4ca"),
+    "technology-trend": SignalTypeStyle("#01579B", "#E1F5FE", "\U0001f680"),
+    "trade-tariff": SignalTypeStyle("#263238", "#ECEFF1", "\U0001f30d"),
 }
 
-_DEFAULT_TYPE = {"color": "#2E75B6", "bg": "#E3F2FD", "icon": "\U0001f4cb"}
+_DEFAULT_TYPE = SignalTypeStyle("#2E75B6", "#E3F2FD", "\U0001f4cb")
 
 # Score threshold for highlighting
 HIGH_SCORE_THRESHOLD = 9.0
 
+# Sentence boundary: sentence-ending punctuation followed by whitespace
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+# Lazy-loaded Jinja2 environment (shared so compiled templates are reused)
+_template_env: Environment | None = None
+
+# Last rendered digest as (context hash, template, html) — see render_digest
+_last_render: tuple[bytes, Template, str] | None = None
+
 
 def _logo_to_data_uri(logo_filename: str, max_height: int | None = None,
                       max_width: int | None = None) -> str:
-    """Load a logo file from config dir, resize, and return a base64 data URI."""
+    """Load a logo file from config dir, resize, and return a base64 data URI.
+
+    Results are memoized per file version, so repeated digest builds skip the
+    decode/resize/encode work for logos that haven't changed on disk.
+    """
     if not logo_filename:
         return ""
     logo_path = CONFIG_DIR / logo_filename
-    if not logo_path.exists():
+    try:
+        mtime_ns = logo_path.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.warning("Logo file not found: %s", logo_path)
         return ""
+    return _encode_logo(logo_path, max_height, max_width, mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _encode_logo(logo_path: Path, max_height: int | None, max_width: int | None,
+                 mtime_ns: int) -> str:
+    """Resize and base64-encode a logo (cached by path, size limits and mtime).
+
+    Logos with transparency are emitted as PNG so the alpha channel survives;
+    opaque logos stay JPEG, which is several times smaller for the
+    photographic JPEG sources in config/. WebP is avoided because Outlook
+    desktop cannot display it.
+    """
     try:
         img = Image.open(logo_path)
-        img = img.convert("RGB")
-        # Resize proportionally
+        has_alpha = img.mode in ("RGBA", "LA") or (
+            img.mode == "P" and "transparency" in img.info
+        )
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        # Shrink proportionally to fit both limits in a single LANCZOS pass
         w, h = img.size
-        if max_width and w > max_width:
-            ratio = max_width / w
-            img = img.resize((max_width, int(h * ratio)), Image.LANCZOS)
-            w, h = img.size
-        if max_height and h > max_height:
-            ratio = max_height / h
-            img = img.resize((int(w * ratio), max_height), Image.LANCZOS)
+        img.thumbnail((max_width or w, max_height or h), Image.LANCZOS)
         buf = io.BytesIO()
-        img.save(buf, format="JPEG", quality=85, optimize=True)
+        if has_alpha:
+            img.save(buf, format="PNG", optimize=True)
+            mime = "image/png"
+        else:
+            img.save(buf, format="JPEG", quality=85, optimize=True)
+            mime = "image/jpeg"
         b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-        return f"data:image/jpeg;base64,{b64}"
+        return f"data:{mime};base64,{b64}"
     except Exception as e:
-        logger.warning("Failed to process logo %s: %s", logo_filename, e)
+        logger.warning("Failed to process logo %s: %s", logo_path.name, e)
         return ""
 
 
+def _process_logos(jobs: dict[str, tuple]) -> dict[str, str]:
+    """Encode several logos concurrently.
+
+    Args:
+        jobs: Mapping of key -> (logo_filename, max_height, max_width).
+
+    Returns:
+        Mapping of the same keys to data URIs. PIL releases the GIL while
+        decoding and encoding, so independent logos overlap on threads.
+    """
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=LOGO_WORKERS) as pool:
+        uris = pool.map(lambda args: _logo_to_data_uri(*args), jobs.values())
+        return dict(zip(jobs, uris))
+
+
 def _to_bullets(text):
     """Jinja2 filter: convert paragraph text to an HTML bullet list.
 
@@ -77,34 +145,87 @@ def _to_bullets(text):
     """
     if not text:
         return ""
+    if isinstance(text, str):
+        return _bullets_markup(text)
+    # AI fields are not type-checked (e.g. a list); render them uncached
+    return _build_bullets(text)
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _bullets_markup(text: str) -> Markup:
+    """Memoized _build_bullets for str/Markup input (stock phrasings repeat often).
+
+    typed=True keeps plain str and Markup inputs with equal text apart,
+    since only the former gets escaped.
+    """
+    return _build_bullets(text)
+
+
+def _build_bullets(text) -> Markup:
+    """Build the to_bullets markup."""
     safe = str(escape(text))
-    # Split on sentence-ending punctuation followed by whitespace
-    parts = [s.strip() for s in re.split(r"(?<=[.!?])\s+", safe) if s.strip()]
+    # Fast path: without a sentence terminator there is nothing to split
+    if "." not in safe and "!" not in safe and "?" not in safe:
+        return Markup(safe)
+    parts = [s.strip() for s in _SENTENCE_SPLIT.split(safe) if s.strip()]
     if len(parts) <= 1:
         return Markup(safe)
-    items = "".join(f"<li>{s}</li>" for s in parts)
     return Markup(
-        f'<ul style="margin:4px 0;padding-left:18px;">{items}</ul>'
+        '<ul style="margin:4px 0;padding-left:18px;">'
+        + "".join([f"<li>{s}</li>" for s in parts])
+        + "</ul>"
     )
 
 
 def get_template_env() -> Environment:
-    """Create Jinja2 template environment with custom filters."""
+    """Get or create the shared Jinja2 template environment with custom filters.
+
+    The environment keeps compiled templates in memory, so digest.html is
+    only lexed and compiled once per process (and again if it changes on disk).
+    Compiled bytecode is also persisted under data/cache/jinja so cold starts
+    (the weekly cron run) skip template compilation entirely.
+    """
+    global _template_env
+    if _template_env is not None:
+        return _template_env
+
+    bytecode_dir = CACHE_DIR / "jinja"
+    bytecode_dir.mkdir(parents=True, exist_ok=True)
     env = Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(bytecode_dir)),
     )
     env.filters["to_bullets"] = _to_bullets
-    return env
+    _template_env = env
+    return _template_env
 
 
-def get_week_number() -> tuple[int, int]:
-    """Get current ISO week number and year."""
-    now = datetime.now()
+def _dedup_key(signal: dict) -> str:
+    """Return a stable identity for a signal (URL, DB id, or headline hash).
+
+    Unlike id(), this survives copies of the signal dict and also collapses
+    the same article collected from two different feeds.
+    """
+    key = signal.get("url") or signal.get("id")
+    if key:
+        return str(key)
+    return hashlib.blake2b(
+        signal.get("headline", "").encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def _week_of(now: datetime) -> tuple[int, int]:
+    """Get the ISO week number and year for a timestamp."""
     iso = now.isocalendar()
     return iso[1], iso[0]
 
 
+def get_week_number() -> tuple[int, int]:
+    """Get current ISO week number and year."""
+    return _week_of(datetime.now())
+
+
 def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
     """Build the template context for a digest.
 
@@ -114,23 +235,28 @@ def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
     - Anchor IDs for in-email navigation from executive summary to detail cards
     - Signal type color assignment
     """
-    week_num, year = get_week_number()
+    # Capture the clock once so week number and date range always agree
+    now = datetime.now()
+    week_num, year = _week_of(now)
 
     # Sort all signals by composite score descending
-    all_sorted = sorted(
-        signals, key=lambda s: s.get("composite_score", 0), reverse=True
-    )
+    for signal in signals:
+        signal.setdefault("composite_score", 0)
+    all_sorted = sorted(signals, key=itemgetter("composite_score"), reverse=True)
 
     # Assign anchor IDs, pre-compute signal type colors, and flag high scores
     for i, signal in enumerate(all_sorted):
         signal["anchor_id"] = str(i)
-        type_info = SIGNAL_TYPE_COLORS.get(
-            signal.get("signal_type", ""), _DEFAULT_TYPE
+        style = SIGNAL_TYPE_COLORS.get(signal.get("signal_type", ""), _DEFAULT_TYPE)
+        signal["type_color"] = style.color
+        signal["type_bg"] = style.bg
+        signal["type_icon"] = style.icon
+        signal["high_score"] = signal["composite_score"] >= HIGH_SCORE_THRESHOLD
+        signal["_dedup_key"] = _dedup_key(signal)
+        # Ordered, de-duplicated BU ids (a tuple keeps "also relevant" stable)
+        signal["_bu_ids"] = tuple(
+            dict.fromkeys(m["bu_id"] for m in signal.get("bu_matches") or ())
         )
-        signal["type_color"] = type_info["color"]
-        signal["type_bg"] = type_info["bg"]
-        signal["type_icon"] = type_info["icon"]
-        signal["high_score"] = signal.get("composite_score", 0) >= HIGH_SCORE_THRESHOLD
 
     # Signal of the week = top signal (shown once, not repeated)
     signal_of_week = all_sorted[0] if all_sorted else None
@@ -138,50 +264,51 @@ def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
     # Top signals for exec summary (exclude signal of the week)
     top_signals = all_sorted[1:6]
 
-    # Group signals by BU
-    bu_signals: dict[str, list[dict]] = {}
-    for signal in signals:
-        for bu_match in signal.get("bu_matches", []):
-            bu_id = bu_match["bu_id"]
-            bu_signals.setdefault(bu_id, []).append(signal)
-
-    for bu_id in bu_signals:
-        bu_signals[bu_id].sort(
-            key=lambda s: s.get("composite_score", 0), reverse=True
-        )
+    # Group signals by BU (walking all_sorted keeps each group score-ordered)
+    bu_signals: dict[str, list[dict]] = defaultdict(list)
+    for signal in all_sorted:
+        for bu_id in signal["_bu_ids"]:
+            bu_signals[bu_id].append(signal)
 
     bu_lookup = {bu["id"]: bu for bu in bu_config.get("business_units", [])}
+    bu_names = {bu_id: bu.get("name", bu_id) for bu_id, bu in bu_lookup.items()}
 
-    # Pre-process BU logos into base64 data URIs
-    bu_logo_cache: dict[str, str] = {}
-    for bu in bu_config.get("business_units", []):
-        logo_file = bu.get("logo_file", "")
-        if logo_file:
-            bu_logo_cache[bu["id"]] = _logo_to_data_uri(
-                logo_file, max_height=BU_LOGO_HEIGHT
-            )
+    # Branding config (copied: bu_config is the shared, cached config dict)
+    branding = dict(bu_config.get("branding", {
+        "logo_url": "",
+        "company_name": "VPG",
+    }))
+
+    # Pre-process BU logos and the header logo into base64 data URIs
+    logo_jobs = {
+        bu["id"]: (bu["logo_file"], BU_LOGO_HEIGHT, None)
+        for bu in bu_config.get("business_units", [])
+        if bu.get("logo_file")
+    }
+    header_logo_file = branding.get("logo_file", "")
+    if header_logo_file:
+        logo_jobs[_HEADER_LOGO_KEY] = (header_logo_file, None, HEADER_LOGO_WIDTH)
+    bu_logo_cache = _process_logos(logo_jobs)
+    if header_logo_file:
+        branding["logo_url"] = bu_logo_cache.pop(_HEADER_LOGO_KEY)
 
     # Build BU sections with cross-BU deduplication
-    seen_ids: set[int] = set()
+    seen_keys: set[str] = set()
     # Exclude signal of the week from BU sections
     if signal_of_week is not None:
-        seen_ids.add(id(signal_of_week))
+        seen_keys.add(signal_of_week["_dedup_key"])
 
     bu_sections = []
     for bu_id, sigs in bu_signals.items():
         bu_info = bu_lookup.get(bu_id, {})
         deduped = []
         for sig in sigs:
-            sig_identity = id(sig)
-            if sig_identity in seen_ids:
+            key = sig["_dedup_key"]
+            if key in seen_keys:
                 continue
-            seen_ids.add(sig_identity)
+            seen_keys.add(key)
             # Mark cross-BU relevance
-            other_bus = [
-                bu_lookup.get(m["bu_id"], {}).get("name", m["bu_id"])
-                for m in sig.get("bu_matches", [])
-                if m["bu_id"] != bu_id
-            ]
+            other_bus = [bu_names.get(b, b) for b in sig["_bu_ids"] if b != bu_id]
             if other_bus:
                 sig["also_relevant_to"] = other_bus
             deduped.append(sig)
@@ -192,27 +319,12 @@ def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
                 "bu_color": bu_info.get("color", "#2E75B6"),
                 "bu_logo_url": bu_logo_cache.get(bu_id, bu_info.get("logo_url", "")),
                 "signals": deduped,
+                # Signals are score-ordered, so the first one is the section max
+                "top_score": deduped[0]["composite_score"],
             })
 
     # Sort BU sections by highest signal score
-    bu_sections.sort(
-        key=lambda s: max(
-            (sig.get("composite_score", 0) for sig in s["signals"]),
-            default=0,
-        ),
-        reverse=True,
-    )
-
-    # Branding config — process header logo
-    branding = bu_config.get("branding", {
-        "logo_url": "",
-        "company_name": "VPG",
-    })
-    header_logo_file = branding.get("logo_file", "")
-    if header_logo_file:
-        branding["logo_url"] = _logo_to_data_uri(
-            header_logo_file, max_width=HEADER_LOGO_WIDTH
-        )
+    bu_sections.sort(key=itemgetter("top_score"), reverse=True)
 
     # Subject line
     top_headline = (
@@ -229,7 +341,7 @@ def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
         "subject": subject,
         "week_number": week_num,
         "year": year,
-        "date_range": datetime.now().strftime("%B %d, %Y"),
+        "date_range": now.strftime("%B %d, %Y"),
         "total_signals": len(signals),
         "bu_count": len(bu_sections),
         "top_signals": top_signals,
@@ -244,10 +356,28 @@ def build_digest_context(signals: list[dict], bu_config: dict) -> dict:
 
 
 def render_digest(context: dict) -> str:
-    """Render the digest HTML from the template context."""
-    env = get_template_env()
-    template = env.get_template("digest.html")
-    return template.render(**context)
+    """Render the digest HTML from the template context.
+
+    Rendering an identical context again (retries, preview-then-send) returns
+    the previously rendered HTML instead of re-running the template, as long
+    as digest.html itself hasn't been reloaded in between.
+    """
+    global _last_render
+    template = get_template_env().get_template("digest.html")
+    try:
+        key = hashlib.blake2b(
+            orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).digest()
+    except TypeError:
+        return template.render(**context)
+
+    if _last_render is not None and _last_render[0] == key and _last_render[1] is template:
+        return _last_render[2]
+
+    html = template.render(**context)
+    _last_render = (key, template, html)
+    return html
 
 
 def save_digest_html(html: str, output_dir: Path, filename: str | None = None) -> Path:
@@ -259,6 +389,6 @@ def save_digest_html(html: str, output_dir: Path, filename: str | None = None) -
         filename = f"digest-{year}-W{week_num:02d}.html"
 
     path = output_dir / filename
-    path.write_text(html, encoding="utf-8")
+    path.write_bytes(html.encode("utf-8"))
     logger.info("Digest saved to %s", path)
     return path
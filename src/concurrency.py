@@ -0,0 +1,76 @@
+"""Thread-pool helpers for VPG Intelligence Digest.
+
+The pipeline's slow steps (feed fetches, corroboration searches, AI scoring,
+email sends) are network-bound, so they fan out on threads. run_parallel
+keeps the one correct pattern in a single place: submit every task first,
+then collect. Calling future.result() inside the submit loop would wait on
+each task before starting the next and silently run everything serially.
+TokenBucket paces those threads against an external rate limit.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_parallel(fn: Callable[[T], R], items: Iterable[T], max_workers: int = 8) -> list[R]:
+    """Call fn on every item using up to max_workers threads.
+
+    Runs inline when there is at most one item or one worker.
+
+    Returns:
+        Results in the same order as items. The first exception raised by
+        fn is re-raised once the remaining tasks have finished.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [fn(item) for item in items]
+
+    results: list = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = {pool.submit(fn, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at per_minute tokens/min.
+
+    Starts full, so a burst up to the per-minute budget goes through at once;
+    after that, callers are paced to the refill rate.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1) -> float:
+        """Block until amount tokens are available and take them.
+
+        Requests larger than the bucket are capped at its capacity.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
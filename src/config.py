@@ -3,10 +3,12 @@
 Loads and provides access to all JSON config files and environment variables.
 """
 
-import json
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,40 +19,51 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
+CACHE_DIR = DATA_DIR / "cache"
 
 
-def _load_json(filename: str) -> dict:
-    """Load a JSON config file from the config directory."""
+def _save_json(filename: str, data: dict) -> None:
+    """Save data to a JSON config file in the config directory."""
     path = CONFIG_DIR / filename
-    with open(path, "r") as f:
-        return json.load(f)
+    path.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    _load_cached.cache_clear()
 
 
-def _save_json(filename: str, data: dict) -> None:
-    """Save data to a JSON config file in the config directory."""
+@lru_cache(maxsize=32)
+def _load_cached(path: Path, mtime_ns: int) -> dict:
+    """Parse a config file once per on-disk version (keyed by path and mtime)."""
+    return orjson.loads(path.read_bytes())
+
+
+def _get_config(filename: str) -> dict:
+    """Return the parsed config file, re-reading it only when it changes on disk.
+
+    The returned dict is shared between callers; copy before mutating.
+    """
     path = CONFIG_DIR / filename
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    return _load_cached(path, path.stat().st_mtime_ns)
 
 
 def get_business_units() -> dict:
     """Load business unit configuration."""
-    return _load_json("business-units.json")
+    return _get_config("business-units.json")
 
 
 def get_sources() -> dict:
     """Load source configuration."""
-    return _load_json("sources.json")
+    return _get_config("sources.json")
 
 
 def get_recipients() -> dict:
     """Load recipient configuration."""
-    return _load_json("recipients.json")
+    return _get_config("recipients.json")
 
 
 def get_scoring_weights() -> dict:
     """Load scoring weights configuration."""
-    return _load_json("scoring-weights.json")
+    return _get_config("scoring-weights.json")
 
 
 def save_business_units(data: dict) -> None:
@@ -73,20 +86,80 @@ def save_scoring_weights(data: dict) -> None:
     _save_json("scoring-weights.json", data)
 
 
-# Environment-based settings
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-ANTHROPIC_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
-ANTHROPIC_TEMPERATURE = float(os.getenv("ANTHROPIC_TEMPERATURE", "0.3"))
-ANTHROPIC_MAX_TOKENS = int(os.getenv("ANTHROPIC_MAX_TOKENS", "4096"))
-
-# Gmail settings
-GMAIL_SENDER_EMAIL = os.getenv("GMAIL_SENDER_EMAIL", "")
-GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD", "")
-
-# Delivery mode: 'mock' (local HTML files), 'smtp' (App Password), or 'gmail' (OAuth2 API)
-DELIVERY_MODE = os.getenv("DELIVERY_MODE", "mock")
-MOCK_OUTPUT_DIR = Path(os.getenv("MOCK_OUTPUT_DIR", str(DATA_DIR / "mock-digests")))
-
-DATABASE_PATH = Path(os.getenv("DATABASE_PATH", str(DATA_DIR / "vpg_intelligence.db")))
-
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-based settings, parsed once per process."""
+
+    anthropic_api_key: str
+    anthropic_model: str
+    anthropic_temperature: float
+    anthropic_max_tokens: int
+    # Client-side request / input-token pacing per minute (0 = off)
+    anthropic_rpm: int
+    anthropic_tpm: int
+    # Scoring batches in flight against the API at once
+    ai_max_concurrency: int
+    # Score through the Message Batches API instead of synchronous calls
+    ai_batch_api: bool
+    gmail_sender_email: str
+    gmail_app_password: str
+    # 'mock' (local HTML files), 'smtp' (App Password), or 'gmail' (OAuth2 API)
+    delivery_mode: str
+    # Park transient send failures in delivery_queue instead of retrying in-process
+    delivery_queue: bool
+    mock_output_dir: Path
+    database_path: Path
+    # Throughput-oriented SQLite PRAGMAs; VPG_SQLITE_FAST=0 for strictest durability
+    sqlite_fast: bool
+    # Log every SQL statement at DEBUG level (VPG_SQL_TRACE=1)
+    sql_trace: bool
+    log_level: str
+
+
+@lru_cache(maxsize=1)
+def settings() -> Settings:
+    """Return the process-wide settings, read from the environment on first use."""
+    return Settings(
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
+        anthropic_model=os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929"),
+        anthropic_temperature=float(os.getenv("ANTHROPIC_TEMPERATURE", "0.3")),
+        anthropic_max_tokens=int(os.getenv("ANTHROPIC_MAX_TOKENS", "4096")),
+        anthropic_rpm=int(os.getenv("ANTHROPIC_RPM", "50")),
+        anthropic_tpm=int(os.getenv("ANTHROPIC_TPM", "0")),
+        ai_max_concurrency=max(1, int(os.getenv("AI_MAX_CONCURRENCY", "4"))),
+        ai_batch_api=os.getenv("AI_BATCH_API", "0") == "1",
+        gmail_sender_email=os.getenv("GMAIL_SENDER_EMAIL", ""),
+        gmail_app_password=os.getenv("GMAIL_APP_PASSWORD", ""),
+        delivery_mode=os.getenv("DELIVERY_MODE", "mock"),
+        delivery_queue=os.getenv("DELIVERY_QUEUE", "0") == "1",
+        mock_output_dir=Path(os.getenv("MOCK_OUTPUT_DIR", str(DATA_DIR / "mock-digests"))),
+        database_path=Path(os.getenv("DATABASE_PATH", str(DATA_DIR / "vpg_intelligence.db"))),
+        sqlite_fast=os.getenv("VPG_SQLITE_FAST", "1") != "0",
+        sql_trace=os.getenv("VPG_SQL_TRACE", "0") == "1",
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+
+# Module-level aliases kept for existing imports
+_settings = settings()
+ANTHROPIC_API_KEY = _settings.anthropic_api_key
+ANTHROPIC_MODEL = _settings.anthropic_model
+ANTHROPIC_TEMPERATURE = _settings.anthropic_temperature
+ANTHROPIC_MAX_TOKENS = _settings.anthropic_max_tokens
+ANTHROPIC_RPM = _settings.anthropic_rpm
+ANTHROPIC_TPM = _settings.anthropic_tpm
+AI_MAX_CONCURRENCY = _settings.ai_max_concurrency
+AI_BATCH_API = _settings.ai_batch_api
+
+GMAIL_SENDER_EMAIL = _settings.gmail_sender_email
+GMAIL_APP_PASSWORD = _settings.gmail_app_password
+
+DELIVERY_MODE = _settings.delivery_mode
+DELIVERY_QUEUE = _settings.delivery_queue
+MOCK_OUTPUT_DIR = _settings.mock_output_dir
+
+DATABASE_PATH = _settings.database_path
+SQLITE_FAST = _settings.sqlite_fast
+SQL_TRACE = _settings.sql_trace
+
+LOG_LEVEL = _settings.log_level
@@ -1,126 +1,269 @@
 """SQLite database manager for VPG Intelligence Digest.
 
 Handles database initialization, connection management, and common queries.
+
+Connections are opened in autocommit mode, so the helpers below do not commit
+on their own: a lone call is committed immediately, and callers group many
+writes into a single commit with ``transaction(conn)``.
 """
 
+import logging
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
-from src.config import DATABASE_PATH, DATA_DIR
+from src.config import DATABASE_PATH, DATA_DIR, SQL_TRACE, SQLITE_FAST
+
+logger = logging.getLogger(__name__)
+
+# SQL is kept in module-level constants so each statement has one stable text:
+# sqlite3's per-connection statement cache is keyed by it, and the queries can
+# be audited with EXPLAIN QUERY PLAN in one place.
+_INSERT_SIGNAL_SQL = """INSERT OR IGNORE INTO signals
+    (external_id, title, summary, url, source_id, source_name, source_tier,
+     published_at, raw_content, image_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Served by idx_signals_status_collected (no sort step)
+_SELECT_SIGNALS_BY_STATUS_SQL = (
+    "SELECT * FROM signals WHERE status = ? ORDER BY collected_at DESC"
+)
+
+_UPDATE_SIGNAL_STATUS_SQL = "UPDATE signals SET status = ? WHERE id = ?"
+
+_INSERT_VALIDATION_SQL = """INSERT INTO signal_validations
+    (signal_id, corroborating_url, corroborating_source,
+     corroborating_title, similarity_score)
+    VALUES (?, ?, ?, ?, ?)"""
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_MAX_IN_PARAMS = 500
+
+_COUNT_VALIDATIONS_SQL = "SELECT COUNT(*) FROM signal_validations WHERE signal_id = ?"
+
+_INSERT_PIPELINE_RUN_SQL = "INSERT INTO pipeline_runs (run_type) VALUES (?)"
+
+_INSERT_ANALYSIS_SQL = """INSERT OR REPLACE INTO signal_analysis
+    (signal_id, signal_type, headline, what_summary, why_it_matters,
+     quick_win, suggested_owner, estimated_impact, outreach_template,
+     score_revenue_impact, score_time_sensitivity,
+     score_strategic_alignment, score_competitive_pressure,
+     score_composite, validation_level, source_count, model_used, raw_ai_response)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_INSERT_SIGNAL_BU_SQL = """INSERT OR IGNORE INTO signal_bus (signal_id, bu_id, relevance_score)
+    VALUES (?, ?, ?)"""
+
+_ENQUEUE_DELIVERY_SQL = """INSERT INTO delivery_queue
+    (recipient_email, subject, html_path, attempts, next_retry_at, last_error)
+    VALUES (?, ?, ?, ?, datetime('now', ?), ?)"""
+
+# Served by idx_delivery_queue_due. A 'sending' row whose claim has expired
+# was left behind by a crashed worker and is due again.
+_SELECT_DUE_DELIVERIES_SQL = """SELECT * FROM delivery_queue
+    WHERE status IN ('pending', 'sending') AND next_retry_at <= datetime('now')
+    ORDER BY next_retry_at LIMIT ?"""
+
+_CLAIM_DELIVERY_SQL = """UPDATE delivery_queue
+    SET status = 'sending', next_retry_at = datetime('now', ?)
+    WHERE id = ?"""
+
+_COUNT_OPEN_DELIVERIES_SQL = """SELECT COUNT(*) FROM delivery_queue
+    WHERE html_path = ? AND status IN ('pending', 'sending')"""
+
+_UPDATE_QUEUED_DELIVERY_SQL = """UPDATE delivery_queue
+    SET status = ?, attempts = ?, next_retry_at = datetime('now', ?), last_error = ?
+    WHERE id = ?"""
 
 
 def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
     """Get a database connection with row factory enabled."""
     path = db_path or DATABASE_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(path))
+    conn = sqlite3.connect(str(path), isolation_level=None)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    if SQL_TRACE:
+        # Log every statement, e.g. to spot per-row (N+1) query loops
+        conn.set_trace_callback(logger.debug)
+    if SQLITE_FAST:
+        # Single-writer workload: in WAL mode NORMAL only risks the last
+        # commits on power loss, never corruption.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
     return conn
 
 
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """Run the enclosed writes as one transaction with a single commit.
+
+    Rolls back if the block raises. Nested use joins the outer transaction,
+    so helpers and stages can be wrapped independently.
+
+    The write lock is taken up front (BEGIN IMMEDIATE): with the pipeline
+    and the delivery worker both writing, a deferred transaction could
+    otherwise fail with SQLITE_BUSY midway when upgrading its read lock.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+@lru_cache(maxsize=1)
+def _schema_sql() -> str:
+    """Read schema.sql once per process."""
+    return (DATA_DIR / "schema.sql").read_text()
+
+
 def init_db(db_path: Path | None = None) -> None:
     """Initialize the database by running the schema SQL."""
-    schema_path = DATA_DIR / "schema.sql"
-    with open(schema_path, "r") as f:
-        schema_sql = f.read()
-
     conn = get_connection(db_path)
     try:
-        conn.executescript(schema_sql)
+        conn.executescript(_schema_sql())
         conn.commit()
     finally:
         conn.close()
 
 
+def _signal_row(signal: dict) -> tuple:
+    """Map a signal dict to the parameter tuple for inserting into signals."""
+    return (
+        signal["external_id"],
+        signal["title"],
+        signal.get("summary"),
+        signal["url"],
+        signal["source_id"],
+        signal["source_name"],
+        signal.get("source_tier", 2),
+        signal.get("published_at"),
+        signal.get("raw_content"),
+        signal.get("image_url"),
+    )
+
+
 def insert_signal(conn: sqlite3.Connection, signal: dict) -> int:
     """Insert a new signal and return its ID."""
-    cursor = conn.execute(
-        """INSERT OR IGNORE INTO signals
-           (external_id, title, summary, url, source_id, source_name, source_tier,
-            published_at, raw_content, image_url)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            signal["external_id"],
-            signal["title"],
-            signal.get("summary"),
-            signal["url"],
-            signal["source_id"],
-            signal["source_name"],
-            signal.get("source_tier", 2),
-            signal.get("published_at"),
-            signal.get("raw_content"),
-            signal.get("image_url"),
-        ),
-    )
-    conn.commit()
+    cursor = conn.execute(_INSERT_SIGNAL_SQL, _signal_row(signal))
     return cursor.lastrowid
 
 
+def insert_signals_bulk(conn: sqlite3.Connection, signals: list[dict]) -> int:
+    """Insert many signals in one executemany batch and transaction.
+
+    Duplicates (by external_id) are ignored, as with insert_signal.
+
+    Returns:
+        Number of newly inserted signals.
+    """
+    with transaction(conn):
+        cursor = conn.executemany(
+            _INSERT_SIGNAL_SQL, [_signal_row(s) for s in signals]
+        )
+    return cursor.rowcount
+
+
+def iter_signals_by_status(conn: sqlite3.Connection, status: str) -> Iterator[dict]:
+    """Yield signals with a given status as SQLite steps through them.
+
+    Rows are fetched lazily, so don't write to the signals table through the
+    same connection while iterating; use get_signals_by_status for a snapshot.
+    """
+    for row in conn.execute(_SELECT_SIGNALS_BY_STATUS_SQL, (status,)):
+        yield dict(row)
+
+
 def get_signals_by_status(conn: sqlite3.Connection, status: str) -> list[dict]:
     """Get all signals with a given status."""
-    cursor = conn.execute(
-        "SELECT * FROM signals WHERE status = ? ORDER BY collected_at DESC",
-        (status,),
-    )
-    return [dict(row) for row in cursor.fetchall()]
+    return list(iter_signals_by_status(conn, status))
 
 
 def update_signal_status(conn: sqlite3.Connection, signal_id: int, status: str) -> None:
     """Update the status of a signal."""
-    conn.execute("UPDATE signals SET status = ? WHERE id = ?", (status, signal_id))
-    conn.commit()
+    conn.execute(_UPDATE_SIGNAL_STATUS_SQL, (status, signal_id))
+
+
+def update_signals_status(conn: sqlite3.Connection, signal_ids: list[int], status: str) -> None:
+    """Set the same status on many signals in one executemany batch and transaction."""
+    with transaction(conn):
+        conn.executemany(_UPDATE_SIGNAL_STATUS_SQL, [(status, sid) for sid in signal_ids])
+
+
+def _validation_row(signal_id: int, validation: dict) -> tuple:
+    """Map a corroboration dict to the signal_validations column order."""
+    return (
+        signal_id,
+        validation["url"],
+        validation["source"],
+        validation.get("title"),
+        validation.get("similarity_score"),
+    )
 
 
 def insert_validation(conn: sqlite3.Connection, signal_id: int, validation: dict) -> int:
     """Insert a validation record for a signal."""
-    cursor = conn.execute(
-        """INSERT INTO signal_validations
-           (signal_id, corroborating_url, corroborating_source,
-            corroborating_title, similarity_score)
-           VALUES (?, ?, ?, ?, ?)""",
-        (
-            signal_id,
-            validation["url"],
-            validation["source"],
-            validation.get("title"),
-            validation.get("similarity_score"),
-        ),
-    )
-    conn.commit()
+    cursor = conn.execute(_INSERT_VALIDATION_SQL, _validation_row(signal_id, validation))
     return cursor.lastrowid
 
 
+def insert_validations_bulk(
+    conn: sqlite3.Connection, validations: list[tuple[int, dict]]
+) -> None:
+    """Insert many (signal_id, validation) records in one executemany batch."""
+    with transaction(conn):
+        conn.executemany(
+            _INSERT_VALIDATION_SQL, [_validation_row(sid, v) for sid, v in validations]
+        )
+
+
+def get_validation_counts(conn: sqlite3.Connection, signal_ids: list[int]) -> dict[int, int]:
+    """Get corroborating-source counts for many signals in one query per chunk.
+
+    Returns:
+        Mapping of signal ID to count; signals with no validations map to 0.
+    """
+    counts = dict.fromkeys(signal_ids, 0)
+    for i in range(0, len(signal_ids), _MAX_IN_PARAMS):
+        chunk = signal_ids[i:i + _MAX_IN_PARAMS]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor = conn.execute(
+            "SELECT signal_id, COUNT(*) FROM signal_validations"
+            f" WHERE signal_id IN ({placeholders}) GROUP BY signal_id",
+            chunk,
+        )
+        counts.update(cursor.fetchall())
+    return counts
+
+
 def get_validation_count(conn: sqlite3.Connection, signal_id: int) -> int:
     """Get the number of corroborating sources for a signal."""
-    cursor = conn.execute(
-        "SELECT COUNT(*) FROM signal_validations WHERE signal_id = ?",
-        (signal_id,),
-    )
+    cursor = conn.execute(_COUNT_VALIDATIONS_SQL, (signal_id,))
     return cursor.fetchone()[0]
 
 
 def insert_pipeline_run(conn: sqlite3.Connection, run_type: str) -> int:
     """Start a new pipeline run and return its ID."""
-    cursor = conn.execute(
-        "INSERT INTO pipeline_runs (run_type) VALUES (?)",
-        (run_type,),
-    )
-    conn.commit()
+    cursor = conn.execute(_INSERT_PIPELINE_RUN_SQL, (run_type,))
     return cursor.lastrowid
 
 
 def insert_analysis(conn: sqlite3.Connection, signal_id: int, analysis: dict) -> int:
     """Insert or update the AI analysis for a signal."""
     cursor = conn.execute(
-        """INSERT OR REPLACE INTO signal_analysis
-           (signal_id, signal_type, headline, what_summary, why_it_matters,
-            quick_win, suggested_owner, estimated_impact, outreach_template,
-            score_revenue_impact, score_time_sensitivity,
-            score_strategic_alignment, score_competitive_pressure,
-            score_composite, validation_level, source_count, model_used, raw_ai_response)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        _INSERT_ANALYSIS_SQL,
         (
             signal_id,
             analysis.get("signal_type", "market-shift"),
@@ -142,19 +285,16 @@ def insert_analysis(conn: sqlite3.Connection, signal_id: int, analysis: dict) ->
             None,
         ),
     )
-    conn.commit()
     return cursor.lastrowid
 
 
 def save_signal_bus(conn: sqlite3.Connection, signal_id: int, bu_matches: list[dict]) -> None:
     """Save business unit associations for a signal."""
-    for match in bu_matches:
-        conn.execute(
-            """INSERT OR IGNORE INTO signal_bus (signal_id, bu_id, relevance_score)
-               VALUES (?, ?, ?)""",
-            (signal_id, match["bu_id"], match.get("relevance_score", 0)),
+    with transaction(conn):
+        conn.executemany(
+            _INSERT_SIGNAL_BU_SQL,
+            [(signal_id, m["bu_id"], m.get("relevance_score", 0)) for m in bu_matches],
         )
-    conn.commit()
 
 
 def complete_pipeline_run(
@@ -172,4 +312,58 @@ def complete_pipeline_run(
         f"UPDATE pipeline_runs SET {', '.join(sets)} WHERE id = ?",
         values,
     )
-    conn.commit()
+
+
+def enqueue_delivery(
+    conn: sqlite3.Connection,
+    recipient: str,
+    subject: str,
+    html_path: Path,
+    delay_seconds: float,
+    attempts: int = 1,
+    error: str | None = None,
+) -> int:
+    """Queue a send to be retried by the delivery worker after delay_seconds."""
+    cursor = conn.execute(
+        _ENQUEUE_DELIVERY_SQL,
+        (recipient, subject, str(html_path), attempts, f"+{int(delay_seconds)} seconds", error),
+    )
+    return cursor.lastrowid
+
+
+def claim_due_deliveries(
+    conn: sqlite3.Connection, limit: int = 50, claim_seconds: float = 600
+) -> list[dict]:
+    """Claim queued sends whose retry time has passed, oldest first.
+
+    Claimed rows are marked 'sending' in the same write transaction that
+    selects them, so concurrent workers never pick up the same row. A claim
+    lapses after claim_seconds, after which the row is due again.
+    """
+    with transaction(conn):
+        rows = conn.execute(_SELECT_DUE_DELIVERIES_SQL, (limit,)).fetchall()
+        conn.executemany(
+            _CLAIM_DELIVERY_SQL,
+            [(f"+{int(claim_seconds)} seconds", row["id"]) for row in rows],
+        )
+    return [dict(row) for row in rows]
+
+
+def count_open_deliveries(conn: sqlite3.Connection, html_path: str) -> int:
+    """Count pending or in-flight queued sends that still need html_path."""
+    return conn.execute(_COUNT_OPEN_DELIVERIES_SQL, (html_path,)).fetchone()[0]
+
+
+def update_queued_delivery(
+    conn: sqlite3.Connection,
+    queue_id: int,
+    status: str,
+    attempts: int,
+    delay_seconds: float = 0,
+    error: str | None = None,
+) -> None:
+    """Record the outcome of a queued send (rescheduled when still pending)."""
+    conn.execute(
+        _UPDATE_QUEUED_DELIVERY_SQL,
+        (status, attempts, f"+{int(delay_seconds)} seconds", error, queue_id),
+    )
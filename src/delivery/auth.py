@@ -14,15 +14,15 @@ This opens a browser for Google account authorization, then saves the
 refresh token to config/token.json for all future API calls.
 """
 
-import json
 import logging
 import os
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
-from google.auth.transport.requests import Request
+import orjson
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 from src.config import CONFIG_DIR
 
@@ -34,6 +34,14 @@ SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
 CREDENTIALS_PATH = CONFIG_DIR / "credentials.json"
 TOKEN_PATH = CONFIG_DIR / "token.json"
 
+# Parsed token.json, reused while the file is unchanged and the token valid
+_cached_creds: Credentials | None = None
+_cached_mtime_ns: int | None = None
+
+# check_auth_status results by deep flag, as (monotonic timestamp, status)
+AUTH_STATUS_TTL = 30
+_auth_status_cache: dict[bool, tuple[float, dict]] = {}
+
 
 def _resolve_credentials_path() -> Path:
     """Return the path to OAuth2 credentials, creating from env var if needed.
@@ -51,16 +59,7 @@ def _resolve_credentials_path() -> Path:
     env_json = os.environ.get("GMAIL_CREDENTIALS_JSON", "").strip()
 
     if env_json:
-        # Validate it's parseable JSON before writing
-        try:
-            json.loads(env_json)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"GMAIL_CREDENTIALS_JSON contains invalid JSON: {e}"
-            )
-        CREDENTIALS_PATH.write_text(env_json)
-        logger.info("Wrote credentials from GMAIL_CREDENTIALS_JSON to %s", CREDENTIALS_PATH)
-        return CREDENTIALS_PATH
+        return _write_env_credentials(env_json, CREDENTIALS_PATH)
 
     if CREDENTIALS_PATH.exists():
         return CREDENTIALS_PATH
@@ -73,25 +72,71 @@ def _resolve_credentials_path() -> Path:
     )
 
 
+@lru_cache(maxsize=1)
+def _validate_env_credentials(env_json: str) -> None:
+    """Check GMAIL_CREDENTIALS_JSON holds a JSON object (parsed once per value)."""
+    # The brace check rejects obvious mistakes (e.g. a file path) without a parse
+    if not (env_json.startswith("{") and env_json.endswith("}")):
+        raise ValueError("GMAIL_CREDENTIALS_JSON must contain a JSON object")
+    try:
+        orjson.loads(env_json)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(
+            f"GMAIL_CREDENTIALS_JSON contains invalid JSON: {e}"
+        )
+
+
+def _write_env_credentials(env_json: str, path: Path) -> Path:
+    """Validate GMAIL_CREDENTIALS_JSON and mirror it to ``path``.
+
+    The write is skipped while the file already holds the same content, so
+    repeated status checks do not rewrite it, but a deleted or rotated file
+    is restored on the next call.
+    """
+    _validate_env_credentials(env_json)
+    try:
+        unchanged = path.read_text() == env_json
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        path.write_text(env_json)
+        logger.info("Wrote credentials from GMAIL_CREDENTIALS_JSON to %s", path)
+    return path
+
+
 def get_credentials() -> Credentials | None:
     """Load or refresh Gmail API credentials.
 
     Returns valid credentials from the stored token, refreshing if expired.
     Returns None if no token exists (needs initial authorization).
+
+    The parsed credentials are cached in-process and reused until token.json
+    changes on disk or the token expires.
     """
-    if not TOKEN_PATH.exists():
+    global _cached_creds, _cached_mtime_ns
+
+    try:
+        mtime_ns = TOKEN_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.info("No token.json found — run 'python -m src.delivery.auth' to authorize")
         return None
 
+    if _cached_creds is not None and _cached_mtime_ns == mtime_ns and _cached_creds.valid:
+        return _cached_creds
+
     creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
 
     if creds.valid:
+        _cached_creds, _cached_mtime_ns = creds, mtime_ns
         return creds
 
     if creds.expired and creds.refresh_token:
+        from google.auth.transport.requests import Request
+
         try:
             creds.refresh(Request())
             _save_token(creds)
+            _cached_creds, _cached_mtime_ns = creds, TOKEN_PATH.stat().st_mtime_ns
             logger.info("Gmail token refreshed successfully")
             return creds
         except Exception as e:
@@ -102,6 +147,14 @@ def get_credentials() -> Credentials | None:
     return None
 
 
+def reset_credentials() -> None:
+    """Drop the cached credentials and auth status (useful for testing or re-auth)."""
+    global _cached_creds, _cached_mtime_ns
+    _cached_creds = None
+    _cached_mtime_ns = None
+    _auth_status_cache.clear()
+
+
 def _save_token(creds: Credentials) -> None:
     """Persist credentials to token.json."""
     token_data = {
@@ -112,7 +165,18 @@ def _save_token(creds: Credentials) -> None:
         "client_secret": creds.client_secret,
         "scopes": creds.scopes,
     }
-    TOKEN_PATH.write_text(json.dumps(token_data, indent=2))
+    data = orjson.dumps(token_data)
+
+    # Write a private temp file, fsync, then atomically swap it in, so a crash
+    # mid-write can never leave a truncated token.json behind
+    tmp_path = TOKEN_PATH.with_suffix(".json.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, TOKEN_PATH)
     logger.info("Token saved to %s", TOKEN_PATH)
 
 
@@ -128,6 +192,8 @@ def run_auth_flow() -> Credentials:
     Raises:
         FileNotFoundError: If credentials.json is missing and no env var set.
     """
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds_path = _resolve_credentials_path()
 
     print("=" * 60)
@@ -150,6 +216,8 @@ def run_auth_flow() -> Credentials:
     )
 
     _save_token(creds)
+    # Forget the old token and any cached "not authorized" status
+    reset_credentials()
 
     print()
     print("Authorization successful!")
@@ -160,12 +228,26 @@ def run_auth_flow() -> Credentials:
     return creds
 
 
-def check_auth_status() -> dict:
+def check_auth_status(deep: bool = False) -> dict:
     """Check the current Gmail authentication status.
 
+    By default this is a cheap check that the credentials and token files
+    exist; pass deep=True to load (and if needed refresh) the token. Results
+    are cached for AUTH_STATUS_TTL seconds so health probes stay off disk.
+
     Returns:
         Dict with 'authorized', 'email' (if available), and 'message'.
     """
+    cached = _auth_status_cache.get(deep)
+    if cached is not None and time.monotonic() - cached[0] < AUTH_STATUS_TTL:
+        return dict(cached[1])
+
+    status = _auth_status(deep)
+    _auth_status_cache[deep] = (time.monotonic(), status)
+    return dict(status)
+
+
+def _auth_status(deep: bool) -> dict:
     try:
         _resolve_credentials_path()
     except (FileNotFoundError, ValueError) as e:
@@ -174,8 +256,8 @@ def check_auth_status() -> dict:
             "message": str(e),
         }
 
-    creds = get_credentials()
-    if creds is None:
+    authorized = get_credentials() is not None if deep else TOKEN_PATH.exists()
+    if not authorized:
         return {
             "authorized": False,
             "credentials_found": True,
@@ -184,7 +266,7 @@ def check_auth_status() -> dict:
 
     return {
         "authorized": True,
-        "message": "Gmail API authorized and ready",
+        "message": "Gmail API authorized and ready" if deep else "Gmail token present",
     }
 
 
@@ -192,7 +274,7 @@ def check_auth_status() -> dict:
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    status = check_auth_status()
+    status = check_auth_status(deep=True)
     if status["authorized"]:
         print("Already authorized. Re-authorizing...")
 
@@ -15,12 +15,20 @@ SMTP setup (recommended):
 
 import base64
 import logging
+import os
+import random
 import smtplib
+import threading
 import time
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from datetime import datetime, timezone
+from email.header import Header
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import orjson
+
+from src.concurrency import run_parallel
 from src.config import (
     DELIVERY_MODE,
     GMAIL_APP_PASSWORD,
@@ -28,28 +36,172 @@ from src.config import (
     MOCK_OUTPUT_DIR,
 )
 
+if TYPE_CHECKING:
+    from email.mime.multipart import MIMEMultipart
+
 logger = logging.getLogger(__name__)
 
 # Lazy-loaded Gmail API service (only for 'gmail' OAuth2 mode)
 _gmail_service = None
 
+# Persistent SMTP connections, one per sending thread (see _get_smtp);
+# smtplib is not safe to share across threads. All open connections are
+# also tracked so close_smtp() can shut every one down at end of batch.
+_smtp_local = threading.local()
+_smtp_open: set[smtplib.SMTP_SSL] = set()
+_smtp_lock = threading.Lock()
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+# Idle time after which the connection is probed with NOOP before reuse
+SMTP_KEEPALIVE_SECONDS = 60
+
+# Gmail API batch requests accept up to 100 calls, but Google advises at most
+# 50 per batch for sends; larger batches trip per-user rateLimitExceeded
+GMAIL_BATCH_SIZE = 50
+# Socket timeout (seconds) for Gmail API calls
+GMAIL_HTTP_TIMEOUT = 30
+
+# Retry backoff: full jitter over RETRY_BASE_DELAY * 2**attempt, capped (seconds)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_WAIT = 30.0
+# API statuses worth retrying; any other HTTP error status is permanent
+RETRYABLE_HTTP_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Failed sends are kept under MOCK_OUTPUT_DIR for offline replay (replay_failed)
+DEAD_LETTER_DIR = "_failed"
+
+PLAIN_TEXT_FALLBACK = "This email requires an HTML-capable email client."
+
+# Filler header that aligns the header block for _gmail_raw
+_PAD_HEADER = b"X-Padding: %s\r\n"
+
+# "=_" cannot occur in base64 or in the ASCII fallback text, so the boundary
+# never collides with part content
+_MIME_BOUNDARY = "=_vpg_digest_alt"
+
 
 def create_email_message(
     to: str, subject: str, html_content: str, sender: str | None = None
-) -> MIMEMultipart:
-    """Create a MIME email message with HTML body and plain-text fallback."""
+) -> "MIMEMultipart":
+    """Create a MIME email message with HTML body and plain-text fallback.
+
+    Sends use build_raw_message; this full email.message tree is kept for
+    callers that want to inspect or extend the message, so the MIME classes
+    are only imported here.
+    """
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
     msg = MIMEMultipart("alternative")
     msg["To"] = to
     msg["From"] = sender or GMAIL_SENDER_EMAIL
     msg["Subject"] = subject
 
-    plain_text = "This email requires an HTML-capable email client."
-    msg.attach(MIMEText(plain_text, "plain"))
+    msg.attach(MIMEText(PLAIN_TEXT_FALLBACK, "plain"))
     msg.attach(MIMEText(html_content, "html"))
 
     return msg
 
 
+def _encode_header(value: str) -> str:
+    """Make a header value safe: no CR/LF injection, RFC 2047 if non-ASCII."""
+    value = value.replace("\r", " ").replace("\n", " ")
+    if value.isascii():
+        return value
+    return Header(value, "utf-8").encode(linesep="\r\n")
+
+
+@lru_cache(maxsize=4)
+def _mime_body(html_content: str) -> bytes:
+    """Build the multipart/alternative body once per digest HTML.
+
+    The body is identical for every recipient, so a fan-out only pays for
+    the base64 encoding once.
+    """
+    html_b64 = base64.encodebytes(html_content.encode("utf-8")).replace(b"\n", b"\r\n")
+    return b"".join((
+        f"--{_MIME_BOUNDARY}\r\n"
+        'Content-Type: text/plain; charset="us-ascii"\r\n'
+        "Content-Transfer-Encoding: 7bit\r\n\r\n"
+        f"{PLAIN_TEXT_FALLBACK}\r\n"
+        f"--{_MIME_BOUNDARY}\r\n"
+        'Content-Type: text/html; charset="utf-8"\r\n'
+        "Content-Transfer-Encoding: base64\r\n\r\n".encode("ascii"),
+        html_b64,
+        f"--{_MIME_BOUNDARY}--\r\n".encode("ascii"),
+    ))
+
+
+@lru_cache(maxsize=4)
+def _mime_body_b64(html_content: str) -> str:
+    """URL-safe base64 of _mime_body, for the Gmail API's 'raw' field."""
+    return base64.urlsafe_b64encode(_mime_body(html_content)).decode("ascii")
+
+
+def _gmail_raw(to: str, subject: str, html_content: str) -> str:
+    """Encode a message for the Gmail API, base64-ing only the headers per call.
+
+    base64 works in 3-byte groups, so once the header block is padded to a
+    multiple of 3 bytes its encoding can simply be prefixed to the cached
+    encoding of the shared body.
+    """
+    # Insert the filler line before the blank separator, 1-3 chars long
+    head = _format_headers(to, subject, GMAIL_SENDER_EMAIL)[:-2]
+    unpadded = len(head) + len(_PAD_HEADER % b"") + 2
+    headers = head + _PAD_HEADER % (b"0" * (1 + (-unpadded - 1) % 3)) + b"\r\n"
+    return base64.urlsafe_b64encode(headers).decode("ascii") + _mime_body_b64(html_content)
+
+
+def _format_headers(to: str, subject: str, sender: str) -> bytes:
+    """The per-recipient header block, ending with the blank separator line."""
+    return (
+        f'Content-Type: multipart/alternative; boundary="{_MIME_BOUNDARY}"\r\n'
+        "MIME-Version: 1.0\r\n"
+        f"To: {_encode_header(to)}\r\n"
+        f"From: {_encode_header(sender)}\r\n"
+        f"Subject: {_encode_header(subject)}\r\n\r\n"
+    ).encode("ascii")
+
+
+def build_raw_message(
+    to: str, subject: str, html_content: str, sender: str | None = None
+) -> bytes:
+    """Serialize the same message as create_email_message straight to bytes.
+
+    Used by both the SMTP and Gmail API paths. Skips building and
+    re-generating a MIMEMultipart tree: the body is built once per digest and
+    only the headers are formatted per recipient.
+    """
+    headers = _format_headers(to, subject, sender or GMAIL_SENDER_EMAIL)
+    return headers + _mime_body(html_content)
+
+
+_FILENAME_TRANS = str.maketrans({"@": "_at_", ".": "_"})
+
+
+@lru_cache(maxsize=1024)
+def _safe_filename(to: str) -> str:
+    """Mock-mode output filename for a recipient address."""
+    return f"digest_{to.translate(_FILENAME_TRANS)}.html"
+
+
+@lru_cache(maxsize=4)
+def _encoded_html(html_content: str) -> bytes:
+    """UTF-8 encode the digest once; every mock recipient gets the same bytes."""
+    return html_content.encode("utf-8")
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write data to path straight through a raw file descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def send_mock(
     to: str, subject: str, html_content: str, output_dir: Path | None = None
 ) -> dict:
@@ -57,11 +209,9 @@ def send_mock(
     out = output_dir or MOCK_OUTPUT_DIR
     out.mkdir(parents=True, exist_ok=True)
 
-    safe_to = to.replace("@", "_at_").replace(".", "_")
-    filename = f"digest_{safe_to}.html"
-    path = out / filename
+    path = out / _safe_filename(to)
 
-    path.write_text(html_content, encoding="utf-8")
+    _write_bytes(path, _encoded_html(html_content))
     logger.info("Mock email saved: %s -> %s", to, path)
 
     return {
@@ -72,6 +222,68 @@ def send_mock(
     }
 
 
+def _get_smtp() -> smtplib.SMTP_SSL:
+    """Get or open this thread's logged-in SMTP connection (SMTP mode).
+
+    The TLS handshake and AUTH are paid once per batch instead of per
+    recipient. A connection idle for longer than SMTP_KEEPALIVE_SECONDS is
+    checked with NOOP and replaced if the server has dropped it.
+    """
+    server = getattr(_smtp_local, "conn", None)
+    if server is not None and server not in _smtp_open:
+        # Closed by close_smtp() from another thread
+        server = None
+    if server is not None and time.monotonic() - _smtp_local.last_used > SMTP_KEEPALIVE_SECONDS:
+        try:
+            alive = server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            alive = False
+        if not alive:
+            _drop_smtp()
+            server = None
+
+    if server is None:
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT)
+        try:
+            server.login(GMAIL_SENDER_EMAIL, GMAIL_APP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        with _smtp_lock:
+            _smtp_open.add(server)
+        _smtp_local.conn = server
+        _smtp_local.last_used = time.monotonic()
+    return server
+
+
+def _quit_smtp(server: smtplib.SMTP_SSL) -> None:
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _drop_smtp() -> None:
+    """Close the calling thread's SMTP connection, if any."""
+    server = getattr(_smtp_local, "conn", None)
+    _smtp_local.conn = None
+    if server is None:
+        return
+    with _smtp_lock:
+        _smtp_open.discard(server)
+    _quit_smtp(server)
+
+
+def close_smtp() -> None:
+    """Close all persistent SMTP connections (call at end of a batch)."""
+    _smtp_local.conn = None
+    with _smtp_lock:
+        servers = list(_smtp_open)
+        _smtp_open.clear()
+    for server in servers:
+        _quit_smtp(server)
+
+
 def send_smtp(to: str, subject: str, html_content: str) -> dict:
     """Send email via Gmail SMTP with App Password.
 
@@ -86,11 +298,22 @@ def send_smtp(to: str, subject: str, html_content: str) -> dict:
             "Generate one at https://myaccount.google.com/apppasswords"
         )
 
-    msg = create_email_message(to, subject, html_content)
+    raw_bytes = build_raw_message(to, subject, html_content)
 
-    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-        server.login(GMAIL_SENDER_EMAIL, GMAIL_APP_PASSWORD)
-        server.send_message(msg)
+    for attempt in range(2):
+        try:
+            _get_smtp().sendmail(GMAIL_SENDER_EMAIL, [to], raw_bytes)
+            break
+        except smtplib.SMTPServerDisconnected:
+            # Server dropped the reused connection; reconnect once and resend
+            _drop_smtp()
+            if attempt:
+                raise
+        except smtplib.SMTPException:
+            # Leave the retry to send_email, on a fresh connection
+            _drop_smtp()
+            raise
+    _smtp_local.last_used = time.monotonic()
 
     logger.info("SMTP email sent to %s from %s", to, GMAIL_SENDER_EMAIL)
 
@@ -107,6 +330,8 @@ def _get_gmail_service():
     if _gmail_service is not None:
         return _gmail_service
 
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
     from googleapiclient.discovery import build
 
     from src.delivery.auth import get_credentials
@@ -117,7 +342,13 @@ def _get_gmail_service():
             "Gmail not authorized. Run 'python -m src.delivery.auth' first."
         )
 
-    _gmail_service = build("gmail", "v1", credentials=creds)
+    # One long-lived transport keeps the TLS connection open across sends,
+    # and the discovery document comes from the library's bundled copy
+    # instead of an HTTPS fetch per process.
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=GMAIL_HTTP_TIMEOUT))
+    _gmail_service = build(
+        "gmail", "v1", http=http, static_discovery=True, cache_discovery=False
+    )
     logger.info("Gmail API service initialized")
     return _gmail_service
 
@@ -125,10 +356,8 @@ def _get_gmail_service():
 def send_gmail(to: str, subject: str, html_content: str) -> dict:
     """Send email via the Gmail API (OAuth2 mode)."""
     service = _get_gmail_service()
-    msg = create_email_message(to, subject, html_content)
 
-    raw_bytes = msg.as_bytes()
-    encoded = base64.urlsafe_b64encode(raw_bytes).decode("ascii")
+    encoded = _gmail_raw(to, subject, html_content)
 
     result = (
         service.users()
@@ -148,13 +377,175 @@ def send_gmail(to: str, subject: str, html_content: str) -> dict:
     }
 
 
+def send_gmail_batch(messages: list[tuple[str, str, str]]) -> list[dict | None]:
+    """Send many emails via the Gmail API, GMAIL_BATCH_SIZE per HTTP request.
+
+    Args:
+        messages: (to, subject, html_content) tuples.
+
+    Returns:
+        One result dict per message, in order. A message whose batch request
+        failed outright is left as None. Permanent per-message failures (see
+        _is_permanent_failure) are dead-lettered and marked not retryable.
+    """
+    service = _get_gmail_service()
+    results: list[dict | None] = [None] * len(messages)
+
+    def _on_send(request_id, response, exception):
+        i = int(request_id)
+        to = messages[i][0]
+        if exception is not None:
+            logger.error("Gmail batch send to %s failed: %s", to, exception)
+            permanent = _is_permanent_failure(exception)
+            results[i] = {
+                "status": "failed",
+                "mode": "gmail",
+                "error": str(exception),
+                "recipient": to,
+                "retryable": not permanent,
+            }
+            if permanent:
+                path = _dead_letter(*messages[i], "gmail", 1, exception)
+                if path is not None:
+                    results[i]["dead_letter"] = str(path)
+        else:
+            results[i] = {
+                "status": "sent",
+                "mode": "gmail",
+                "gmail_message_id": response.get("id", ""),
+                "recipient": to,
+            }
+
+    for start in range(0, len(messages), GMAIL_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_send)
+        for i, (to, subject, html_content) in enumerate(
+            messages[start:start + GMAIL_BATCH_SIZE], start
+        ):
+            encoded = _gmail_raw(to, subject, html_content)
+            batch.add(
+                service.users().messages().send(userId="me", body={"raw": encoded}),
+                request_id=str(i),
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.error("Gmail batch request failed: %s", e)
+
+    sent = sum(1 for r in results if r and r["status"] == "sent")
+    logger.info("Gmail batch sent %d/%d emails", sent, len(messages))
+    return results
+
+
+def _is_permanent_failure(error: Exception) -> bool:
+    """True for delivery errors that a retry cannot fix.
+
+    SMTP 5xx replies, refused recipients and HTTP errors outside
+    RETRYABLE_HTTP_STATUS are permanent. Anything else (disconnects, timeouts,
+    4xx SMTP replies, unknown errors) is treated as transient.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 500 <= error.smtp_code < 600
+    # googleapiclient HttpError (checked by attribute to keep the import lazy)
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status is not None:
+        return int(status) not in RETRYABLE_HTTP_STATUS
+    return False
+
+
+def _dead_letter(
+    to: str, subject: str, html_content: str, mode: str, attempts: int, error: Exception
+) -> Path | None:
+    """Spill a failed send to DEAD_LETTER_DIR with an .error.json sidecar.
+
+    File names carry the failure time, so repeated failures to the same
+    recipient are all kept until replay_failed runs.
+
+    Returns:
+        The .error.json path, or None if the files could not be written.
+    """
+    out = MOCK_OUTPUT_DIR / DEAD_LETTER_DIR
+    failed_at = datetime.now(timezone.utc)
+    stem = f"{_safe_filename(to).removesuffix('.html')}-{failed_at:%Y%m%dT%H%M%S%f}"
+    meta = {
+        "recipient": to,
+        "subject": subject,
+        "mode": mode,
+        "attempts": attempts,
+        "last_error": str(error),
+        "failed_at": failed_at.isoformat(timespec="seconds"),
+    }
+    try:
+        out.mkdir(parents=True, exist_ok=True)
+        _write_bytes(out / f"{stem}.html", _encoded_html(html_content))
+        _write_bytes(out / f"{stem}.error.json", orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+    except OSError as e:
+        logger.error("Could not dead-letter message to %s: %s", to, e)
+        return None
+    logger.warning("Dead-lettered message to %s -> %s", to, out)
+    return out / f"{stem}.error.json"
+
+
+def replay_failed(max_retries: int = 3) -> list[dict]:
+    """Re-send every dead-lettered message with a fresh delivery client.
+
+    Messages that go out are removed from the dead-letter directory; ones
+    that fail again are re-written there with the new error. A message that
+    only reached send_email's mock fallback (auth missing) is kept as is.
+
+    Returns:
+        One send result per dead-lettered message.
+    """
+    out = MOCK_OUTPUT_DIR / DEAD_LETTER_DIR
+    if not out.is_dir():
+        return []
+
+    reset_service()
+    close_smtp()
+    results = []
+    try:
+        for meta_path in sorted(out.glob("*.error.json")):
+            html_path = meta_path.with_name(meta_path.name.removesuffix(".error.json") + ".html")
+            try:
+                meta = orjson.loads(meta_path.read_bytes())
+                html = html_path.read_text(encoding="utf-8")
+            except (OSError, orjson.JSONDecodeError) as e:
+                logger.error("Skipping unreadable dead letter %s: %s", meta_path, e)
+                continue
+
+            result = send_email(meta["recipient"], meta["subject"], html, max_retries)
+            delivered = result["status"] == "sent" and result.get("mode") == DELIVERY_MODE
+            # A repeat failure has been dead-lettered afresh under a new name
+            if delivered or result.get("dead_letter"):
+                meta_path.unlink(missing_ok=True)
+                html_path.unlink(missing_ok=True)
+            results.append(result)
+    finally:
+        close_smtp()
+    return results
+
+
 def send_email(
-    to: str, subject: str, html_content: str, max_retries: int = 3
+    to: str,
+    subject: str,
+    html_content: str,
+    max_retries: int = 3,
+    dead_letter: bool = True,
 ) -> dict:
     """Send an email using the configured delivery mode with retry logic.
 
-    Retries with exponential backoff on transient failures.
+    Retries transient failures with capped, full-jitter exponential backoff;
+    permanent ones (see _is_permanent_failure) fail immediately. Failed
+    results carry 'retryable' so callers can hand transient failures to the
+    delivery queue (src.delivery.worker) instead of sleeping here; pass
+    max_retries=1 to skip in-process retries entirely.
     Falls back to mock mode if auth is missing.
+
+    Failed sends are written to the dead-letter directory for replay_failed:
+    permanent failures always, transient ones unless dead_letter is False
+    (callers that queue them for a later retry). The result's 'dead_letter'
+    key then holds the .error.json path.
     """
     mode = DELIVERY_MODE
 
@@ -179,22 +570,81 @@ def send_email(
 
         except Exception as e:
             logger.error("Delivery attempt %d/%d failed: %s", attempt + 1, max_retries, e)
-            if attempt < max_retries - 1:
-                wait = 2 ** (attempt + 1)
-                logger.info("Retrying in %ds...", wait)
+            permanent = _is_permanent_failure(e)
+            if attempt < max_retries - 1 and not permanent:
+                wait = random.uniform(0, min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_WAIT))
+                logger.info("Retrying in %.1fs...", wait)
                 time.sleep(wait)
             else:
-                return {
+                result = {
                     "status": "failed",
                     "mode": mode,
                     "error": str(e),
                     "recipient": to,
+                    "retryable": not permanent,
                 }
+                if permanent or dead_letter:
+                    path = _dead_letter(to, subject, html_content, mode, attempt + 1, e)
+                    if path is not None:
+                        result["dead_letter"] = str(path)
+                return result
 
     return {"status": "failed", "mode": mode, "recipient": to}
 
 
-def reset_service() -> None:
-    """Reset the cached Gmail service (useful for testing or re-auth)."""
+def send_email_many(
+    messages: list[tuple[str, str, str]],
+    max_retries: int = 3,
+    max_workers: int = 8,
+    dead_letter: bool = True,
+) -> list[dict]:
+    """Send many emails with the configured delivery mode.
+
+    In 'gmail' mode all messages go out as batched API requests first; any
+    that fail transiently are then retried one by one through send_email
+    (with its backoff and mock fallback), while permanent failures are
+    dead-lettered by the batch. Other modes send concurrently on up to
+    max_workers threads, each with its own SMTP connection.
+
+    Args:
+        messages: (to, subject, html_content) tuples.
+        max_retries: Attempts per message, passed to send_email.
+        max_workers: Sending threads in 'smtp' and 'mock' modes.
+        dead_letter: Passed to send_email for each message.
+
+    Returns:
+        One result dict per message, in order.
+    """
+    if DELIVERY_MODE == "gmail":
+        try:
+            results = send_gmail_batch(messages)
+        except RuntimeError as e:
+            # Auth not configured; send_email applies the mock fallback per message
+            logger.warning("Gmail batch unavailable: %s", e)
+            results = [None] * len(messages)
+
+        # The API client is not thread-safe, so retries stay sequential
+        return [
+            result if result and (result["status"] == "sent" or not result["retryable"])
+            else send_email(to, subject, html, max_retries, dead_letter)
+            for (to, subject, html), result in zip(messages, results)
+        ]
+
+    return run_parallel(
+        lambda message: send_email(*message, max_retries, dead_letter), messages, max_workers
+    )
+
+
+def reset_service(reset_creds: bool = False) -> None:
+    """Reset the cached Gmail service (useful for testing or re-auth).
+
+    The OAuth credentials are cached separately in src.delivery.auth and
+    survive a service reset, so rebuilding the client does not re-read or
+    refresh the token; pass reset_creds=True to drop them as well.
+    """
     global _gmail_service
     _gmail_service = None
+    if reset_creds:
+        from src.delivery.auth import reset_credentials
+
+        reset_credentials()
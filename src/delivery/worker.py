@@ -0,0 +1,172 @@
+"""Delivery retry worker for VPG Intelligence Digest.
+
+With DELIVERY_QUEUE=1, sends that fail transiently are parked in the
+delivery_queue table with a next_retry_at time instead of holding the
+pipeline in a backoff sleep. Each pipeline run first sends whatever is due;
+between runs this worker picks up due rows and dispatches them again.
+
+Usage:
+    python -m src.delivery.worker           # poll forever (e.g. as a service)
+    python -m src.delivery.worker --once    # process due rows and exit (cron)
+
+Example crontab entry:
+    */5 * * * * cd /path/to/vpg && python -m src.delivery.worker --once
+"""
+
+import argparse
+import logging
+import random
+import sqlite3
+import time
+from pathlib import Path
+
+from src.config import DELIVERY_MODE, MOCK_OUTPUT_DIR
+from src.db import (
+    claim_due_deliveries,
+    count_open_deliveries,
+    enqueue_delivery,
+    get_connection,
+    init_db,
+    update_queued_delivery,
+)
+from src.delivery.gmail import close_smtp, send_email
+
+logger = logging.getLogger(__name__)
+
+QUEUE_RETRY_BASE_SECONDS = 60
+QUEUE_RETRY_MAX_SECONDS = 3600
+QUEUE_MAX_ATTEMPTS = 6
+QUEUE_BATCH_SIZE = 50
+# How long a claimed row stays with its worker before it counts as abandoned
+QUEUE_CLAIM_SECONDS = 600
+POLL_SECONDS = 30
+
+# Per-run digest copies referenced by queued rows (under MOCK_OUTPUT_DIR)
+QUEUE_SNAPSHOT_DIR = "_queue"
+
+
+def queue_backoff(attempts: int) -> float:
+    """Jittered exponential delay before the next attempt, in seconds."""
+    ceiling = min(QUEUE_RETRY_BASE_SECONDS * 2 ** (attempts - 1), QUEUE_RETRY_MAX_SECONDS)
+    return random.uniform(QUEUE_RETRY_BASE_SECONDS, ceiling)
+
+
+def _snapshot_digest(html: str, run_id: int) -> Path:
+    """Save this run's digest HTML for queued retries.
+
+    The weekly digest file is overwritten when the pipeline re-runs in the
+    same week, so queued rows point at a per-run copy instead.
+    """
+    out = MOCK_OUTPUT_DIR / QUEUE_SNAPSHOT_DIR
+    out.mkdir(parents=True, exist_ok=True)
+    path = out / f"digest-run{run_id}.html"
+    path.write_bytes(html.encode("utf-8"))
+    return path
+
+
+def queue_failed_sends(
+    conn: sqlite3.Connection, results: list[dict], subject: str, html: str, run_id: int
+) -> list[dict]:
+    """Queue retryable failures from a send and mark their results 'queued'.
+
+    Permanent failures and successful sends are returned unchanged.
+    """
+    html_path = None
+    queued = []
+    for result in results:
+        if result["status"] == "failed" and result.get("retryable"):
+            if html_path is None:
+                html_path = _snapshot_digest(html, run_id)
+            queue_id = enqueue_delivery(
+                conn, result["recipient"], subject, html_path,
+                queue_backoff(1), error=result.get("error"),
+            )
+            result = {**result, "status": "queued", "queue_id": queue_id}
+        queued.append(result)
+    return queued
+
+
+def process_due_deliveries(conn: sqlite3.Connection, limit: int = QUEUE_BATCH_SIZE) -> int:
+    """Dispatch queued sends whose retry time has passed.
+
+    Rows are claimed before sending (see claim_due_deliveries), so the
+    pipeline and any number of workers can drain the queue at once without
+    emailing anyone twice. Each row gets one attempt; transient failures
+    are rescheduled with a longer backoff until QUEUE_MAX_ATTEMPTS, then
+    marked failed and dead-lettered (see src.delivery.gmail.replay_failed).
+    A digest snapshot is deleted once no open rows reference it.
+
+    Returns:
+        Number of rows processed.
+    """
+    rows = claim_due_deliveries(conn, limit, QUEUE_CLAIM_SECONDS)
+    html_cache: dict[str, str] = {}
+    try:
+        for row in rows:
+            attempts = row["attempts"] + 1
+            path = row["html_path"]
+            try:
+                if path not in html_cache:
+                    html_cache[path] = Path(path).read_text(encoding="utf-8")
+            except OSError as e:
+                logger.error("Queued digest %s unreadable: %s", path, e)
+                update_queued_delivery(conn, row["id"], "failed", attempts, error=str(e))
+                continue
+
+            result = send_email(
+                row["recipient_email"], row["subject"], html_cache[path],
+                max_retries=1, dead_letter=attempts >= QUEUE_MAX_ATTEMPTS,
+            )
+            if result["status"] == "sent" and result.get("mode") != DELIVERY_MODE:
+                # send_email's mock fallback (auth missing) delivered nothing
+                result = {
+                    "status": "failed",
+                    "error": f"{DELIVERY_MODE} delivery unavailable; saved as {result.get('mode')}",
+                    "retryable": True,
+                }
+            if result["status"] == "sent":
+                update_queued_delivery(conn, row["id"], "sent", attempts)
+            elif result.get("retryable") and attempts < QUEUE_MAX_ATTEMPTS:
+                update_queued_delivery(
+                    conn, row["id"], "pending", attempts,
+                    queue_backoff(attempts), result.get("error"),
+                )
+            else:
+                update_queued_delivery(conn, row["id"], "failed", attempts, error=result.get("error"))
+            logger.info(
+                "Queued delivery to %s (attempt %d): %s",
+                row["recipient_email"], attempts, result["status"],
+            )
+    finally:
+        close_smtp()
+
+    snapshot_dir = MOCK_OUTPUT_DIR / QUEUE_SNAPSHOT_DIR
+    for path in {row["html_path"] for row in rows}:
+        if Path(path).parent == snapshot_dir and not count_open_deliveries(conn, path):
+            Path(path).unlink(missing_ok=True)
+    return len(rows)
+
+
+def run_worker(poll_seconds: float = POLL_SECONDS, once: bool = False) -> None:
+    """Process the delivery queue, polling every poll_seconds."""
+    init_db()
+    conn = get_connection()
+    try:
+        while True:
+            processed = process_due_deliveries(conn)
+            if once:
+                return
+            # A full batch means more rows may already be due
+            if processed < QUEUE_BATCH_SIZE:
+                time.sleep(poll_seconds)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process the delivery retry queue")
+    parser.add_argument("--once", action="store_true", help="Process due rows and exit")
+    parser.add_argument("--poll", type=float, default=POLL_SECONDS, help="Seconds between polls")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    run_worker(args.poll, args.once)
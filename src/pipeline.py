@@ -5,16 +5,21 @@ Collection -> Validation -> Analysis -> Scoring -> Composition -> Delivery
 """
 
 import logging
+import sqlite3
 import sys
 from datetime import datetime
 
 from src.analyzer.client import AnalysisClient
-from src.analyzer.scorer import score_batch_ai, score_signal
+from src.analyzer.scorer import score_all_batch_api, score_batch_ai, score_signal
 from src.collector.rss_collector import collect_all_rss
 from src.collector.web_scraper import collect_all_scraped
 from src.composer.composer import build_digest_context, render_digest, save_digest_html
+from src.concurrency import run_parallel
 from src.config import (
+    AI_BATCH_API,
+    AI_MAX_CONCURRENCY,
     DELIVERY_MODE,
+    DELIVERY_QUEUE,
     LOG_LEVEL,
     LOGS_DIR,
     MOCK_OUTPUT_DIR,
@@ -26,21 +31,29 @@ from src.db import (
     complete_pipeline_run,
     get_connection,
     get_signals_by_status,
+    get_validation_counts,
     init_db,
     insert_analysis,
     insert_pipeline_run,
-    insert_signal,
+    insert_signals_bulk,
+    insert_validations_bulk,
     save_signal_bus,
+    transaction,
     update_signal_status,
+    update_signals_status,
 )
-from src.delivery.gmail import send_email
-from src.validator.validator import validate_signal
+from src.delivery.gmail import close_smtp, send_email_many
+from src.delivery.worker import process_due_deliveries, queue_failed_sends
+from src.validator.validator import assess_signal
 
 logger = logging.getLogger(__name__)
 
 # Batch size for AI analysis (balance cost vs. reliability)
 AI_BATCH_SIZE = 10
 
+# Concurrent corroboration searches during validation
+VALIDATION_MAX_WORKERS = 8
+
 
 def setup_logging() -> None:
     """Configure logging for the pipeline."""
@@ -62,15 +75,13 @@ def stage_collect(conn) -> int:
     """Stage 1: Collect signals from all sources."""
     logger.info("=== Stage 1: Collection ===")
 
-    rss_signals = collect_all_rss()
-    scraped_signals = collect_all_scraped()
+    # RSS feeds and scraped pages are independent network fan-outs
+    rss_signals, scraped_signals = run_parallel(
+        lambda collect: collect(), [collect_all_rss, collect_all_scraped], max_workers=2
+    )
     all_signals = rss_signals + scraped_signals
 
-    inserted = 0
-    for signal in all_signals:
-        row_id = insert_signal(conn, signal)
-        if row_id:
-            inserted += 1
+    inserted = insert_signals_bulk(conn, all_signals)
 
     logger.info("Collected %d signals, %d new", len(all_signals), inserted)
     return inserted
@@ -81,22 +92,69 @@ def stage_validate(conn) -> int:
     logger.info("=== Stage 2: Validation ===")
 
     new_signals = get_signals_by_status(conn, "new")
-    validated = 0
+    prior_counts = get_validation_counts(conn, [s["id"] for s in new_signals])
 
-    for signal in new_signals:
-        validate_signal(conn, signal)
-        update_signal_status(conn, signal["id"], "validated")
-        validated += 1
+    # The corroboration searches are network-bound and DB-free, so they run
+    # on a thread pool before the write lock is taken; the results are then
+    # stored from this thread in one commit.
+    results = run_parallel(
+        lambda s: assess_signal(s, prior_counts[s["id"]]), new_signals, VALIDATION_MAX_WORKERS
+    )
+    corroborations = [
+        (signal["id"], corr)
+        for signal, result in zip(new_signals, results)
+        for corr in result["corroborations"]
+    ]
+
+    with transaction(conn):
+        insert_validations_bulk(conn, corroborations)
+        update_signals_status(conn, [s["id"] for s in new_signals], "validated")
+
+    logger.info("Validated %d signals", len(new_signals))
+    return len(new_signals)
+
+
+def _score_batch(batch: list[dict], client: AnalysisClient) -> list[dict]:
+    """Score one batch: a single AI call when possible, else per signal."""
+    if client.available and len(batch) > 1:
+        return score_batch_ai(batch, client)
+    # Individual scoring (AI with fallback)
+    return [score_signal(s, client) for s in batch]
+
+
+def _persist_scored_batch(
+    conn, batch: list[dict], results: list[dict], min_score: float
+) -> list[dict]:
+    """Save a scored batch in one commit; return its signals above min_score."""
+    above = []
+    with transaction(conn):
+        for signal, analysis in zip(batch, results):
+            signal.update(analysis)
+            signal["composite_score"] = analysis["composite"]
 
-    logger.info("Validated %d signals", validated)
-    return validated
+            # Persist analysis to DB
+            insert_analysis(conn, signal["id"], analysis)
+            save_signal_bus(conn, signal["id"], analysis.get("bu_matches", []))
+            update_signal_status(conn, signal["id"], "scored")
+
+            # Only include signals above the threshold
+            if analysis["composite"] >= min_score:
+                above.append(signal)
+            else:
+                logger.debug(
+                    "Signal below threshold (%.1f < %.1f): %s",
+                    analysis["composite"], min_score, signal.get("title", "?")[:50],
+                )
+    return above
 
 
 def stage_score(conn) -> list[dict]:
     """Stage 3 & 4: Score and analyze validated signals with AI.
 
     Uses Anthropic API for analysis when available, with heuristic fallback.
-    Processes signals in batches for cost efficiency.
+    Processes signals in batches for cost efficiency; up to
+    AI_MAX_CONCURRENCY batches are in flight at once, and the results are
+    persisted here on the calling thread in batch order.
     """
     logger.info("=== Stage 3-4: AI Scoring & Analysis ===")
 
@@ -118,33 +176,27 @@ def stage_score(conn) -> list[dict]:
     scored_signals = []
 
     # Process in batches for API efficiency
-    for i in range(0, len(validated_signals), AI_BATCH_SIZE):
-        batch = validated_signals[i:i + AI_BATCH_SIZE]
-
-        if client.available and len(batch) > 1:
-            # Batch AI scoring
-            results = score_batch_ai(batch, client)
-        else:
-            # Individual scoring (AI with fallback)
-            results = [score_signal(s, client) for s in batch]
-
-        for signal, analysis in zip(batch, results):
-            signal.update(analysis)
-            signal["composite_score"] = analysis["composite"]
+    batches = [
+        validated_signals[i:i + AI_BATCH_SIZE]
+        for i in range(0, len(validated_signals), AI_BATCH_SIZE)
+    ]
+
+    batch_job = None
+    if AI_BATCH_API and client.available:
+        # One Message Batches job for the whole run; None -> synchronous path
+        batch_job = score_all_batch_api(validated_signals, client, AI_BATCH_SIZE)
+
+    if batch_job is not None:
+        for i, batch in enumerate(batches):
+            results = batch_job[i * AI_BATCH_SIZE:(i + 1) * AI_BATCH_SIZE]
+            scored_signals.extend(_persist_scored_batch(conn, batch, results, min_score))
+    else:
+        workers = AI_MAX_CONCURRENCY if client.available else 1
+        batch_results = run_parallel(lambda b: _score_batch(b, client), batches, workers)
 
-            # Persist analysis to DB
-            insert_analysis(conn, signal["id"], analysis)
-            save_signal_bus(conn, signal["id"], analysis.get("bu_matches", []))
-            update_signal_status(conn, signal["id"], "scored")
-
-            # Only include signals above the threshold
-            if analysis["composite"] >= min_score:
-                scored_signals.append(signal)
-            else:
-                logger.debug(
-                    "Signal below threshold (%.1f < %.1f): %s",
-                    analysis["composite"], min_score, signal.get("title", "?")[:50],
-                )
+        # SQLite writes stay on this thread
+        for batch, results in zip(batches, batch_results):
+            scored_signals.extend(_persist_scored_batch(conn, batch, results, min_score))
 
     scored_signals.sort(key=lambda s: s["composite_score"], reverse=True)
 
@@ -174,27 +226,46 @@ def stage_compose(scored_signals: list[dict]) -> tuple[str, str]:
     return html, subject
 
 
-def stage_deliver(html: str, subject: str) -> list[dict]:
-    """Stage 6: Deliver the digest to recipients."""
+def stage_deliver(
+    html: str,
+    subject: str,
+    conn: sqlite3.Connection | None = None,
+    run_id: int | None = None,
+) -> list[dict]:
+    """Stage 6: Deliver the digest to recipients.
+
+    By default each send is retried in-process with backoff. With
+    DELIVERY_QUEUE enabled (and a connection and run id), each recipient
+    gets one attempt and transient failures go to the delivery queue
+    instead; due rows left by earlier runs are sent first, and between runs
+    the queue is drained by ``python -m src.delivery.worker``.
+    """
     logger.info("=== Stage 6: Delivery (mode: %s) ===", DELIVERY_MODE)
 
+    queue = DELIVERY_QUEUE and conn is not None and run_id is not None
+    if queue:
+        process_due_deliveries(conn)
+
     recipients_config = get_recipients()
-    results = []
+    messages = [
+        (recipient["email"], subject, html)
+        for recipient in recipients_config.get("recipients", [])
+        if recipient.get("status") == "active"
+    ]
 
-    for recipient in recipients_config.get("recipients", []):
-        if recipient.get("status") != "active":
-            continue
+    try:
+        results = send_email_many(messages, max_retries=1 if queue else 3, dead_letter=not queue)
+    finally:
+        close_smtp()
+    if queue:
+        results = queue_failed_sends(conn, results, subject, html, run_id)
 
-        result = send_email(
-            to=recipient["email"],
-            subject=subject,
-            html_content=html,
-        )
-        results.append(result)
-        logger.info("Delivery to %s: %s", recipient["email"], result["status"])
+    for result in results:
+        logger.info("Delivery to %s: %s", result.get("recipient"), result["status"])
 
     sent = sum(1 for r in results if r["status"] == "sent")
-    logger.info("Delivered to %d/%d recipients", sent, len(results))
+    queued = sum(1 for r in results if r["status"] == "queued")
+    logger.info("Delivered to %d/%d recipients (%d queued for retry)", sent, len(results), queued)
     return results
 
 
@@ -232,7 +303,7 @@ def run_full_pipeline() -> dict:
         html, subject = stage_compose(scored_signals)
 
         # Stage 6: Deliver
-        delivery_results = stage_deliver(html, subject)
+        delivery_results = stage_deliver(html, subject, conn, run_id)
 
         complete_pipeline_run(
             conn, run_id, "completed",
@@ -7,7 +7,7 @@ the 3-source validation requirement.
 import logging
 from urllib.parse import urlparse
 
-from src.db import get_validation_count, insert_validation
+from src.db import get_validation_count, get_validation_counts, insert_validation
 
 logger = logging.getLogger(__name__)
 
@@ -43,17 +43,17 @@ def find_corroborating_sources(signal: dict, max_results: int = 5) -> list[dict]
     return []
 
 
-def validate_signal(conn, signal: dict) -> dict:
-    """Validate a single signal by finding corroborating sources.
+def assess_signal(signal: dict, prior_count: int = 0) -> dict:
+    """Find independent corroborations for a signal without touching the DB.
 
     Args:
-        conn: Database connection.
         signal: Signal dict (must include 'id' and 'url').
+        prior_count: Corroborations already stored for the signal.
 
     Returns:
-        Validation result dict with 'level', 'source_count', 'corroborations'.
+        Validation result dict with 'level', 'source_count', 'corroborations'
+        (the new independent sources, not yet stored).
     """
-    signal_id = signal["id"]
     original_domain = get_source_domain(signal["url"])
 
     corroborations = find_corroborating_sources(signal)
@@ -65,13 +65,8 @@ def validate_signal(conn, signal: dict) -> dict:
         if corr_domain != original_domain:
             independent.append(corr)
 
-    # Store validations in DB
-    for corr in independent:
-        insert_validation(conn, signal_id, corr)
-
     # Determine validation level (original counts as 1 source)
-    existing_count = get_validation_count(conn, signal_id)
-    total_sources = max(1 + len(independent), 1 + existing_count)
+    total_sources = 1 + prior_count + len(independent)
 
     if total_sources >= 3:
         level = "verified"
@@ -80,7 +75,7 @@ def validate_signal(conn, signal: dict) -> dict:
     else:
         level = "unverified"
 
-    logger.info("Signal %d: %s (%d sources)", signal_id, level, total_sources)
+    logger.info("Signal %d: %s (%d sources)", signal["id"], level, total_sources)
 
     return {
         "level": level,
@@ -89,11 +84,36 @@ def validate_signal(conn, signal: dict) -> dict:
     }
 
 
+def validate_signal(conn, signal: dict, prior_count: int | None = None) -> dict:
+    """Validate a single signal by finding corroborating sources.
+
+    Args:
+        conn: Database connection.
+        signal: Signal dict (must include 'id' and 'url').
+        prior_count: Corroborations already stored for the signal, when the
+            caller has fetched them in bulk (see get_validation_counts).
+
+    Returns:
+        Validation result dict with 'level', 'source_count', 'corroborations'.
+    """
+    if prior_count is None:
+        prior_count = get_validation_count(conn, signal["id"])
+
+    result = assess_signal(signal, prior_count)
+
+    # Store validations in DB
+    for corr in result["corroborations"]:
+        insert_validation(conn, signal["id"], corr)
+
+    return result
+
+
 def validate_batch(conn, signals: list[dict]) -> list[dict]:
     """Validate a batch of signals."""
+    counts = get_validation_counts(conn, [s["id"] for s in signals])
     results = []
     for signal in signals:
-        result = validate_signal(conn, signal)
+        result = validate_signal(conn, signal, counts[signal["id"]])
         result["signal_id"] = signal["id"]
         results.append(result)
     return results
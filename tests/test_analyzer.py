@@ -5,11 +5,13 @@ using mocked API responses.
 """
 
 import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.analyzer.client import AnalysisClient
+from src.analyzer import client as analyzer_client
+from src.analyzer.client import CHARS_PER_TOKEN, AnalysisClient, _throttle, reset_rate_limits
 from src.analyzer.prompts import (
     VALID_SIGNAL_TYPES,
     build_signal_prompt,
@@ -20,11 +22,13 @@ from src.analyzer.scorer import (
     _validate_ai_result,
     calculate_composite_score,
     match_signal_to_bus,
+    score_all_batch_api,
     score_batch_ai,
     score_signal,
     score_signal_ai,
     score_signal_heuristic,
 )
+from src.concurrency import run_parallel
 
 
 # -- Sample data --
@@ -154,6 +158,56 @@ class TestAnalysisClient:
             assert result["signal_type"] == "competitive-threat"
             mock_client.messages.create.assert_called_once()
 
+    def test_token_budget_paces_requests(self):
+        try:
+            with patch("src.analyzer.client.ANTHROPIC_RPM", 0), \
+                 patch("src.analyzer.client.ANTHROPIC_TPM", 6000):  # 100 tokens/s
+                reset_rate_limits()
+                _throttle("x" * 6000 * CHARS_PER_TOKEN, "")
+                start = time.monotonic()
+                _throttle("", "y" * 10 * CHARS_PER_TOKEN)
+                assert time.monotonic() - start > 0.05
+        finally:
+            reset_rate_limits()
+
+    def test_concurrent_first_calls_share_buckets(self):
+        try:
+            with patch("src.analyzer.client.ANTHROPIC_RPM", 60), \
+                 patch("src.analyzer.client.ANTHROPIC_TPM", 0):
+                reset_rate_limits()
+                bucket = analyzer_client._request_bucket
+                run_parallel(lambda _: _throttle("", ""), range(8), max_workers=8)
+                assert analyzer_client._request_bucket is bucket
+                assert analyzer_client._token_bucket is None
+                assert bucket._tokens < 60 - 7
+        finally:
+            reset_rate_limits()
+
+    def test_batch_job_polls_and_orders_results(self):
+        with patch("src.analyzer.client.anthropic.Anthropic") as MockAnthropic, \
+             patch("src.analyzer.client.time.sleep") as sleep:
+            mock_client = MagicMock()
+            MockAnthropic.return_value = mock_client
+            batches = mock_client.messages.batches
+            batches.create.return_value = MagicMock(id="b1", processing_status="in_progress")
+            batches.retrieve.return_value = MagicMock(id="b1", processing_status="ended")
+
+            def entry(custom_id, text=None):
+                result = MagicMock(type="succeeded" if text else "errored")
+                result.message.content = [MagicMock(text=text)]
+                return MagicMock(custom_id=custom_id, result=result)
+
+            batches.results.return_value = [entry("1", '{"n": 1}'), entry("0", '{"n": 0}'), entry("2")]
+
+            client = AnalysisClient(api_key="test-key")
+            results = client.analyze_batch_job("system", ["a", "b", "c"], poll_seconds=5)
+
+        assert results == [{"n": 0}, {"n": 1}, None]
+        sleep.assert_called_once_with(5)
+        requests = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[1]["params"]["messages"] == [{"role": "user", "content": "b"}]
+
 
 # -- Validation Tests --
 
@@ -274,6 +328,24 @@ class TestScorer:
         assert len(results) == 2
         assert all(r["analysis_method"] == "heuristic" for r in results)
 
+    def test_batch_api_scores_groups_in_order(self):
+        mock_client = MagicMock(spec=AnalysisClient)
+        mock_client.available = True
+        mock_client.analyze_batch_job.return_value = [
+            [SAMPLE_AI_RESPONSE, SAMPLE_AI_RESPONSE], [SAMPLE_AI_RESPONSE],
+        ]
+
+        results = score_all_batch_api([SAMPLE_SIGNAL] * 3, client=mock_client, batch_size=2)
+
+        assert len(mock_client.analyze_batch_job.call_args.args[1]) == 2
+        assert [r["analysis_method"] for r in results] == ["ai-batch"] * 3
+
+    def test_batch_api_returns_none_when_job_fails(self):
+        mock_client = MagicMock(spec=AnalysisClient)
+        mock_client.available = True
+        mock_client.analyze_batch_job.return_value = None
+        assert score_all_batch_api([SAMPLE_SIGNAL], client=mock_client) is None
+
     def test_all_valid_signal_types(self):
         expected = {
             "competitive-threat", "revenue-opportunity", "market-shift",
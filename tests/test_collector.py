@@ -0,0 +1,167 @@
+"""Tests for the RSS collector's feed parsing."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lxml import etree
+
+from src.collector.rss_collector import _parse_feed_lxml, collect_all_rss, collect_from_feed
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Robotics News</title>
+    <item>
+      <title>Humanoid robot adopts new force sensors</title>
+      <link>https://example.com/humanoid</link>
+      <description>Load cells in every joint.</description>
+      <pubDate>Mon, 16 Feb 2026 10:30:00 +0100</pubDate>
+      <media:content url="https://example.com/humanoid.jpg" medium="image"/>
+    </item>
+    <item>
+      <title>Steel mill expansion</title>
+      <link>https://example.com/steel</link>
+      <enclosure url="https://example.com/steel.png" type="image/png" length="1"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Aerospace Testing</title>
+  <entry>
+    <title>New crash test DAQ released</title>
+    <link rel="alternate" href="https://example.com/daq"/>
+    <link rel="enclosure" href="https://example.com/daq.jpg" type="image/jpeg"/>
+    <summary>Miniature data acquisition.</summary>
+    <updated>2026-02-15T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+
+class TestLxmlFeedParser:
+    def test_parses_rss_items(self):
+        entries = _parse_feed_lxml(RSS_FEED)
+        assert len(entries) == 2
+        first = entries[0]
+        assert first["title"] == "Humanoid robot adopts new force sensors"
+        assert first["link"] == "https://example.com/humanoid"
+        assert first["summary"] == "Load cells in every joint."
+        # Normalized to UTC, like feedparser
+        assert tuple(first["published_parsed"][:5]) == (2026, 2, 16, 9, 30)
+        assert first["media_content"][0]["url"] == "https://example.com/humanoid.jpg"
+        assert entries[1]["enclosures"][0]["href"] == "https://example.com/steel.png"
+
+    def test_parses_atom_entries(self):
+        entries = _parse_feed_lxml(ATOM_FEED)
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["link"] == "https://example.com/daq"
+        assert entry["summary"] == "Miniature data acquisition."
+        assert tuple(entry["published_parsed"][:4]) == (2026, 2, 15, 8)
+        assert entry["enclosures"] == [
+            {"href": "https://example.com/daq.jpg", "type": "image/jpeg"}
+        ]
+
+    def test_rss_content_encoded_and_dc_date(self):
+        feed = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel><item>
+    <title>Body only in content</title>
+    <link>https://example.com/content</link>
+    <content:encoded><![CDATA[<p>Body</p>]]></content:encoded>
+    <dc:date>2026-02-14T12:00:00Z</dc:date>
+  </item></channel>
+</rss>"""
+        entry = _parse_feed_lxml(feed)[0]
+        assert entry["summary"] == "<p>Body</p>"
+        assert tuple(entry["published_parsed"][:4]) == (2026, 2, 14, 12)
+
+    def test_atom_xhtml_content_is_flattened(self):
+        feed = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>XHTML entry</title>
+    <link href="https://example.com/xhtml"/>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Strain <b>gauge</b> news</p></div></content>
+    <updated>2026-02-15T08:00:00Z</updated>
+  </entry>
+</feed>"""
+        entry = _parse_feed_lxml(feed)[0]
+        assert entry["summary"] == "Strain gauge news"
+
+    def test_rss_permalink_guid_used_as_link(self):
+        feed = b"""<?xml version="1.0"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title>Guid only</title>
+      <guid>https://example.com/guid-only</guid>
+    </item>
+    <item>
+      <title>Opaque guid</title>
+      <guid isPermaLink="false">tag:example.com,2026:42</guid>
+    </item>
+  </channel>
+</rss>"""
+        entries = _parse_feed_lxml(feed)
+        assert entries[0]["link"] == "https://example.com/guid-only"
+        assert entries[1]["link"] == ""
+
+    def test_malformed_xml_raises(self):
+        with pytest.raises(etree.XMLSyntaxError):
+            _parse_feed_lxml(b"<rss><channel><item><title>broken")
+
+
+class TestCollectFromFeed:
+    SOURCE = {"id": "test-feed", "name": "Test Feed", "url": "https://example.com/feed", "tier": 2}
+
+    def _response(self, body: bytes) -> MagicMock:
+        response = MagicMock()
+        response.content = body
+        return response
+
+    def test_builds_signals_from_lxml_entries(self):
+        with patch("src.collector.rss_collector.requests.get", return_value=self._response(RSS_FEED)):
+            signals = collect_from_feed(self.SOURCE)
+        assert [s["image_url"] for s in signals] == [
+            "https://example.com/humanoid.jpg",
+            "https://example.com/steel.png",
+        ]
+        assert signals[0]["published_at"] == "2026-02-16T09:30:00"
+        assert signals[0]["source_id"] == "test-feed"
+
+    def test_falls_back_to_feedparser_on_bad_xml(self):
+        body = b"<rss><channel><item><title>Loose</title><link>https://example.com/x</link></item>"
+        with patch("src.collector.rss_collector.requests.get", return_value=self._response(body)):
+            signals = collect_from_feed(self.SOURCE)
+        assert len(signals) == 1
+        assert signals[0]["url"] == "https://example.com/x"
+
+
+class TestCollectAllRss:
+    SOURCES = {
+        "sources": [
+            {"id": "a", "type": "rss"},
+            {"id": "b", "type": "rss"},
+            {"id": "c", "type": "scrape"},
+            {"id": "d", "type": "rss", "active": False},
+        ]
+    }
+
+    def test_feeds_fetched_concurrently_in_source_order(self):
+        # Both feeds must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_collect(source):
+            barrier.wait()
+            return [{"source_id": source["id"]}]
+
+        with patch("src.collector.rss_collector.get_sources", return_value=self.SOURCES), \
+             patch("src.collector.rss_collector.collect_from_feed", side_effect=fake_collect):
+            signals = collect_all_rss()
+        assert [s["source_id"] for s in signals] == ["a", "b"]
@@ -0,0 +1,129 @@
+"""Tests for the digest composer."""
+
+from unittest.mock import patch
+
+from PIL import Image
+
+from src.composer import composer
+from src.composer.composer import (
+    _encode_logo,
+    _logo_to_data_uri,
+    _to_bullets,
+    build_digest_context,
+    render_digest,
+)
+
+BU_CONFIG = {
+    "business_units": [
+        {"id": "vpg-force-sensors", "name": "VPG Force Sensors"},
+        {"id": "kelk", "name": "KELK"},
+        {"id": "dts", "name": "DTS"},
+    ],
+}
+
+
+def _signal(sid: int, score: float, bus: list[str], url: str | None = None) -> dict:
+    return {
+        "id": sid,
+        "url": url or f"https://example.com/{sid}",
+        "headline": f"Signal {sid}",
+        "composite_score": score,
+        "signal_type": "market-shift",
+        "bu_matches": [{"bu_id": b, "relevance_score": 0.5} for b in bus],
+    }
+
+
+class TestToBullets:
+    def test_multiple_sentences_become_list(self):
+        html = str(_to_bullets("First point. Second point! Third?"))
+        assert html.count("<li>") == 3
+        assert html.startswith("<ul")
+
+    def test_single_sentence_without_terminator(self):
+        assert str(_to_bullets("Review signal with the BU team")) == "Review signal with the BU team"
+
+    def test_escapes_markup(self):
+        html = str(_to_bullets("<script>alert(1)</script> first. Second."))
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+
+    def test_non_string_input_renders_uncached(self):
+        html = str(_to_bullets(["a. b", "c"]))
+        assert "<li>" in html
+
+    def test_empty_text(self):
+        assert _to_bullets("") == ""
+        assert _to_bullets(None) == ""
+
+
+class TestLogoProcessing:
+    def setup_method(self):
+        _encode_logo.cache_clear()
+
+    def test_logo_data_uri_is_memoized(self, tmp_path):
+        Image.new("RGB", (400, 100), "navy").save(tmp_path / "logo.jpg")
+        with patch("src.composer.composer.CONFIG_DIR", tmp_path):
+            first = _logo_to_data_uri("logo.jpg", max_width=200)
+            second = _logo_to_data_uri("logo.jpg", max_width=200)
+        assert first.startswith("data:image/")
+        assert first == second
+        assert _encode_logo.cache_info().hits == 1
+
+    def test_transparent_logo_keeps_alpha_as_png(self, tmp_path):
+        Image.new("RGBA", (120, 60), (0, 0, 128, 0)).save(tmp_path / "logo.png")
+        with patch("src.composer.composer.CONFIG_DIR", tmp_path):
+            assert _logo_to_data_uri("logo.png", max_height=30).startswith("data:image/png;")
+
+    def test_opaque_logo_stays_jpeg(self, tmp_path):
+        Image.new("RGB", (120, 60), "navy").save(tmp_path / "logo.jpg")
+        with patch("src.composer.composer.CONFIG_DIR", tmp_path):
+            assert _logo_to_data_uri("logo.jpg", max_height=30).startswith("data:image/jpeg;")
+
+    def test_missing_logo_returns_empty(self, tmp_path):
+        with patch("src.composer.composer.CONFIG_DIR", tmp_path):
+            assert _logo_to_data_uri("missing.jpg") == ""
+
+
+class TestBuildDigestContext:
+    def test_signal_shown_once_with_cross_bu_tag(self):
+        signals = [
+            _signal(1, 9.5, ["kelk"]),
+            _signal(2, 8.0, ["vpg-force-sensors", "kelk"]),
+            _signal(3, 6.0, ["kelk"]),
+        ]
+        context = build_digest_context(signals, BU_CONFIG)
+
+        assert context["signal_of_week"]["id"] == 1
+        shown = [s["id"] for sec in context["bu_sections"] for s in sec["signals"]]
+        assert sorted(shown) == [2, 3]
+        sig2 = next(s for s in signals if s["id"] == 2)
+        assert sig2["also_relevant_to"] == ["VPG Force Sensors"]
+
+    def test_same_article_from_two_feeds_is_deduplicated(self):
+        signals = [
+            _signal(1, 9.0, ["dts"]),
+            _signal(2, 7.0, ["kelk"], url="https://example.com/shared"),
+            _signal(3, 6.0, ["kelk"], url="https://example.com/shared"),
+        ]
+        context = build_digest_context(signals, BU_CONFIG)
+        kelk = next(sec for sec in context["bu_sections"] if sec["bu_id"] == "kelk")
+        assert [s["id"] for s in kelk["signals"]] == [2]
+
+
+class TestRenderDigest:
+    def setup_method(self):
+        composer._last_render = None
+
+    def test_identical_context_reuses_rendered_html(self):
+        context = build_digest_context([_signal(1, 9.0, ["kelk"])], BU_CONFIG)
+        with patch("jinja2.Template.render", return_value="<html></html>") as render:
+            first = render_digest(context)
+            second = render_digest(dict(context))
+        assert first == second == "<html></html>"
+        assert render.call_count == 1
+
+    def test_changed_context_renders_again(self):
+        context = build_digest_context([_signal(1, 9.0, ["kelk"])], BU_CONFIG)
+        first = render_digest(context)
+        context["subject"] = "Changed subject line"
+        assert render_digest(context) != first
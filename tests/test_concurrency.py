@@ -0,0 +1,52 @@
+"""Tests for the thread-pool helpers."""
+
+import time
+
+import pytest
+
+from src.concurrency import TokenBucket, run_parallel
+
+
+class TestRunParallel:
+    def test_tasks_overlap(self):
+        latency = 0.1
+
+        def slow(x):
+            time.sleep(latency)
+            return x
+
+        start = time.monotonic()
+        run_parallel(slow, range(8), max_workers=8)
+        assert time.monotonic() - start < 8 * latency * 0.5
+
+    def test_results_keep_input_order(self):
+        def staggered(x):
+            time.sleep(0.01 * (5 - x))
+            return x * 10
+
+        assert run_parallel(staggered, range(5), max_workers=5) == [0, 10, 20, 30, 40]
+
+    def test_single_worker_runs_inline(self):
+        assert run_parallel(str, [1, 2], max_workers=1) == ["1", "2"]
+        assert run_parallel(str, []) == []
+
+    def test_exception_propagates(self):
+        def fail_on_two(x):
+            if x == 2:
+                raise ValueError("two")
+            return x
+
+        with pytest.raises(ValueError, match="two"):
+            run_parallel(fail_on_two, range(4), max_workers=4)
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(600)  # 10 tokens/s
+        assert bucket.acquire(600) == 0
+        waited = bucket.acquire(1)
+        assert 0.05 < waited < 0.5
+
+    def test_oversized_request_capped_at_capacity(self):
+        bucket = TokenBucket(600)
+        assert bucket.acquire(10_000) == 0
@@ -1,10 +1,14 @@
 """Tests for the configuration module."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src import config
+
 # Project root for locating config files
 PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_DIR = PROJECT_ROOT / "config"
@@ -106,3 +110,45 @@ class TestDatabaseSchema:
         ]
         for table in required_tables:
             assert f"CREATE TABLE IF NOT EXISTS {table}" in schema, f"Missing table: {table}"
+
+
+class TestConfigCache:
+    """Test the mtime-keyed caching of config accessors."""
+
+    def setup_method(self):
+        config._load_cached.cache_clear()
+
+    def teardown_method(self):
+        config._load_cached.cache_clear()
+
+    def test_get_sources_cached_until_saved(self, tmp_path):
+        (tmp_path / "sources.json").write_text(json.dumps({"sources": []}))
+        with patch("src.config.CONFIG_DIR", tmp_path):
+            first = config.get_sources()
+            assert config.get_sources() is first
+
+            config.save_sources({"sources": [{"id": "new"}]})
+            assert config.get_sources()["sources"][0]["id"] == "new"
+
+    def test_external_edit_invalidates_cache(self, tmp_path):
+        path = tmp_path / "recipients.json"
+        path.write_text(json.dumps({"recipients": []}))
+        with patch("src.config.CONFIG_DIR", tmp_path):
+            assert config.get_recipients() == {"recipients": []}
+            path.write_text(json.dumps({"recipients": [{"email": "a@vpgsensors.com"}]}))
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+            assert config.get_recipients()["recipients"][0]["email"] == "a@vpgsensors.com"
+            assert config._load_cached.cache_info().misses == 2
+
+
+class TestSettings:
+    def test_settings_parsed_once_and_frozen(self):
+        first = config.settings()
+        assert config.settings() is first
+        assert config.ANTHROPIC_MODEL == first.anthropic_model
+        with pytest.raises(AttributeError):
+            first.delivery_mode = "smtp"
+
+    def test_ai_concurrency_is_at_least_one(self):
+        with patch.dict(os.environ, {"AI_MAX_CONCURRENCY": "0"}):
+            assert config.settings.__wrapped__().ai_max_concurrency == 1
@@ -3,10 +3,26 @@
 import sqlite3
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.db import get_connection, init_db, insert_signal, get_signals_by_status, update_signal_status
+from src.db import (
+    get_connection,
+    get_signals_by_status,
+    get_validation_count,
+    get_validation_counts,
+    init_db,
+    insert_validation,
+    insert_signal,
+    insert_signals_bulk,
+    insert_validations_bulk,
+    iter_signals_by_status,
+    save_signal_bus,
+    transaction,
+    update_signal_status,
+    update_signals_status,
+)
 
 
 @pytest.fixture
@@ -32,6 +48,23 @@ class TestDatabase:
         assert "delivery_log" in tables
         assert "feedback" in tables
 
+    def test_connection_pragmas(self, tmp_db):
+        assert tmp_db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert tmp_db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert tmp_db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert tmp_db.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_signals_by_status_uses_index_without_sort(self, tmp_db):
+        from src.db import _SELECT_SIGNALS_BY_STATUS_SQL
+
+        plan = " ".join(
+            row[3] for row in tmp_db.execute(
+                "EXPLAIN QUERY PLAN " + _SELECT_SIGNALS_BY_STATUS_SQL, ("new",)
+            )
+        )
+        assert "idx_signals_status_collected" in plan
+        assert "TEMP B-TREE" not in plan
+
     def test_insert_signal(self, tmp_db):
         signal = {
             "external_id": "test-123",
@@ -77,6 +110,21 @@ class TestDatabase:
         new_signals = get_signals_by_status(tmp_db, "new")
         assert len(new_signals) >= 1
 
+    def test_iter_signals_by_status_is_lazy(self, tmp_db):
+        insert_signals_bulk(tmp_db, [
+            {
+                "external_id": f"iter-{i}",
+                "title": f"Iter {i}",
+                "url": f"https://example.com/iter/{i}",
+                "source_id": "src",
+                "source_name": "Src",
+            }
+            for i in range(2)
+        ])
+        rows = iter_signals_by_status(tmp_db, "new")
+        assert not isinstance(rows, list)
+        assert sorted(r["external_id"] for r in rows) == ["iter-0", "iter-1"]
+
     def test_update_signal_status(self, tmp_db):
         signal = {
             "external_id": "update-test",
@@ -95,3 +143,133 @@ class TestDatabase:
         update_signal_status(tmp_db, signal_id, "validated")
         validated = get_signals_by_status(tmp_db, "validated")
         assert any(s["id"] == signal_id for s in validated)
+
+    def test_insert_signals_bulk_counts_new_rows(self, tmp_db):
+        signals = [
+            {
+                "external_id": f"bulk-{i}",
+                "title": f"Bulk {i}",
+                "url": f"https://example.com/bulk/{i}",
+                "source_id": "src",
+                "source_name": "Src",
+            }
+            for i in range(3)
+        ]
+        assert insert_signals_bulk(tmp_db, signals) == 3
+        # Re-inserting the same batch plus one new signal only adds the new one
+        signals.append({**signals[0], "external_id": "bulk-new"})
+        assert insert_signals_bulk(tmp_db, signals) == 1
+        assert len(get_signals_by_status(tmp_db, "new")) == 4
+
+    def test_bulk_validations_and_status_updates(self, tmp_db):
+        signals = [
+            {
+                "external_id": f"val-{i}",
+                "title": f"Val {i}",
+                "url": f"https://example.com/val/{i}",
+                "source_id": "src",
+                "source_name": "Src",
+            }
+            for i in range(3)
+        ]
+        insert_signals_bulk(tmp_db, signals)
+        ids = [s["id"] for s in get_signals_by_status(tmp_db, "new")]
+
+        insert_validations_bulk(tmp_db, [
+            (ids[0], {"url": "https://a.com/1", "source": "A"}),
+            (ids[0], {"url": "https://b.com/1", "source": "B"}),
+        ])
+        update_signals_status(tmp_db, ids[:2], "validated")
+
+        assert get_validation_counts(tmp_db, ids) == {ids[0]: 2, ids[1]: 0, ids[2]: 0}
+        assert len(get_signals_by_status(tmp_db, "validated")) == 2
+        assert len(get_signals_by_status(tmp_db, "new")) == 1
+
+    def test_get_validation_counts_matches_per_signal_counts(self, tmp_db):
+        insert_signals_bulk(tmp_db, [
+            {
+                "external_id": f"val-{i}",
+                "title": f"Val {i}",
+                "url": f"https://example.com/val/{i}",
+                "source_id": "src",
+                "source_name": "Src",
+            }
+            for i in range(3)
+        ])
+        ids = sorted(s["id"] for s in get_signals_by_status(tmp_db, "new"))
+        for n, signal_id in enumerate(ids):
+            for j in range(n):
+                insert_validation(tmp_db, signal_id, {
+                    "url": f"https://other.com/{signal_id}/{j}", "source": "Other",
+                })
+
+        with patch("src.db._MAX_IN_PARAMS", 2):
+            counts = get_validation_counts(tmp_db, ids)
+        assert counts == {sid: get_validation_count(tmp_db, sid) for sid in ids}
+        assert list(counts.values()) == [0, 1, 2]
+
+    def test_save_signal_bus(self, tmp_db):
+        insert_signal(tmp_db, {
+            "external_id": "bus-test",
+            "title": "BU Test",
+            "url": "https://example.com/bu",
+            "source_id": "src",
+            "source_name": "Src",
+        })
+        signal_id = get_signals_by_status(tmp_db, "new")[0]["id"]
+        matches = [
+            {"bu_id": "kelk", "relevance_score": 0.9},
+            {"bu_id": "dts", "relevance_score": 0.4},
+        ]
+        save_signal_bus(tmp_db, signal_id, matches)
+        save_signal_bus(tmp_db, signal_id, matches)
+        rows = tmp_db.execute(
+            "SELECT bu_id FROM signal_bus WHERE signal_id = ? ORDER BY bu_id", (signal_id,)
+        ).fetchall()
+        assert [r["bu_id"] for r in rows] == ["dts", "kelk"]
+
+
+class TestTransaction:
+    SIGNAL = {
+        "external_id": "txn-test",
+        "title": "Txn Test",
+        "url": "https://example.com/txn",
+        "source_id": "src",
+        "source_name": "Src",
+    }
+
+    def test_commits_on_success(self, tmp_db, tmp_path):
+        with transaction(tmp_db):
+            insert_signal(tmp_db, self.SIGNAL)
+            assert tmp_db.in_transaction
+        assert not tmp_db.in_transaction
+        other = get_connection(tmp_path / "test.db")
+        try:
+            assert len(get_signals_by_status(other, "new")) == 1
+        finally:
+            other.close()
+
+    def test_rolls_back_on_error(self, tmp_db):
+        with pytest.raises(RuntimeError):
+            with transaction(tmp_db):
+                insert_signal(tmp_db, self.SIGNAL)
+                raise RuntimeError("boom")
+        assert get_signals_by_status(tmp_db, "new") == []
+
+    def test_nested_joins_outer_transaction(self, tmp_db):
+        with pytest.raises(RuntimeError):
+            with transaction(tmp_db):
+                with transaction(tmp_db):
+                    insert_signal(tmp_db, self.SIGNAL)
+                assert tmp_db.in_transaction
+                raise RuntimeError("boom")
+        assert get_signals_by_status(tmp_db, "new") == []
+
+    def test_write_lock_taken_at_begin(self, tmp_db, tmp_path):
+        other = sqlite3.connect(tmp_path / "test.db", timeout=0, isolation_level=None)
+        try:
+            with transaction(tmp_db):
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+        finally:
+            other.close()
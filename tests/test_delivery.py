@@ -1,20 +1,56 @@
 """Tests for the delivery module (Gmail API + mock mode)."""
 
+import base64
+import email
+import email.policy
 import json
+import os
+import smtplib
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.delivery.auth import CREDENTIALS_PATH, TOKEN_PATH, check_auth_status
+from src.db import enqueue_delivery, get_connection, init_db
+from src.delivery.auth import (
+    CREDENTIALS_PATH,
+    TOKEN_PATH,
+    check_auth_status,
+    _save_token,
+    get_credentials,
+    reset_credentials,
+    run_auth_flow,
+)
 from src.delivery.gmail import (
+    DEAD_LETTER_DIR,
+    build_raw_message,
+    close_smtp,
     create_email_message,
+    replay_failed,
     reset_service,
     send_email,
+    send_email_many,
     send_gmail,
+    send_gmail_batch,
     send_mock,
     send_smtp,
 )
+from src.delivery.worker import (
+    QUEUE_MAX_ATTEMPTS,
+    process_due_deliveries,
+    queue_failed_sends,
+)
+from src.pipeline import stage_deliver
+
+
+@pytest.fixture(autouse=True)
+def _isolated_output_dir(tmp_path):
+    """Keep dead letters and queue snapshots out of the real output dir."""
+    with patch("src.delivery.gmail.MOCK_OUTPUT_DIR", tmp_path / "output"), \
+         patch("src.delivery.worker.MOCK_OUTPUT_DIR", tmp_path / "output"):
+        yield
 
 
 # -- Mock mode tests --
@@ -42,6 +78,12 @@ class TestMockDelivery:
         assert len(files) == 1
         assert "@" not in files[0].name
 
+    def test_send_mock_overwrites_with_utf8_bytes(self, tmp_path):
+        send_mock("user@example.com", "Subject", "<p>" + "x" * 5000 + "</p>", tmp_path)
+        send_mock("user@example.com", "Subject", "<p>Grüße</p>", tmp_path)
+        written = tmp_path / "digest_user_at_example_com.html"
+        assert written.read_bytes() == "<p>Grüße</p>".encode("utf-8")
+
 
 # -- Email message creation --
 
@@ -65,18 +107,54 @@ class TestEmailMessage:
         assert payloads[1].get_content_type() == "text/html"
 
 
+    def test_raw_message_matches_mime_structure(self):
+        html = "<html><body>Caf\u00e9 \u2014 signals</body></html>"
+        raw = build_raw_message(
+            "to@test.com", "VPG Intel \u2014 Week 7", html, sender="from@test.com"
+        )
+        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        assert msg["To"] == "to@test.com"
+        assert msg["From"] == "from@test.com"
+        assert msg["Subject"] == "VPG Intel \u2014 Week 7"
+
+        parts = list(msg.iter_parts())
+        assert [p.get_content_type() for p in parts] == ["text/plain", "text/html"]
+        assert parts[1].get_content() == html
+
+    def test_gmail_raw_reuses_encoded_body(self):
+        from src.delivery.gmail import _gmail_raw, _mime_body_b64
+
+        _mime_body_b64.cache_clear()
+        html = "<html><body>" + "x" * 1000 + "</body></html>"
+        for to in ("a@test.com", "bb@test.com", "ccc@test.com"):
+            raw = base64.urlsafe_b64decode(_gmail_raw(to, "Subject", html))
+            msg = email.message_from_bytes(raw, policy=email.policy.default)
+            assert msg["To"] == to
+            assert list(msg.iter_parts())[1].get_content() == html
+        assert _mime_body_b64.cache_info().misses == 1
+
+    def test_raw_message_strips_header_newlines(self):
+        raw = build_raw_message("to@test.com", "Hi\r\nBcc: evil@x.com", "<p/>", "f@test.com")
+        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        assert msg["Bcc"] is None
+
+
 # -- SMTP delivery tests --
 
 
 class TestSmtpDelivery:
+    def setup_method(self):
+        close_smtp()
+
+    def teardown_method(self):
+        close_smtp()
+
     def test_send_smtp_success(self):
         """SMTP send with mocked smtplib."""
         with patch("src.delivery.gmail.GMAIL_SENDER_EMAIL", "sender@gmail.com"), \
              patch("src.delivery.gmail.GMAIL_APP_PASSWORD", "abcd efgh ijkl mnop"), \
              patch("src.delivery.gmail.smtplib.SMTP_SSL") as mock_ssl:
-            mock_server = MagicMock()
-            mock_ssl.return_value.__enter__ = MagicMock(return_value=mock_server)
-            mock_ssl.return_value.__exit__ = MagicMock(return_value=False)
+            mock_server = mock_ssl.return_value
 
             result = send_smtp("to@test.com", "Test Subject", "<p>Hello</p>")
 
@@ -84,7 +162,34 @@ class TestSmtpDelivery:
         assert result["mode"] == "smtp"
         assert result["recipient"] == "to@test.com"
         mock_server.login.assert_called_once_with("sender@gmail.com", "abcd efgh ijkl mnop")
-        mock_server.send_message.assert_called_once()
+        mock_server.sendmail.assert_called_once()
+        sender, rcpts, raw = mock_server.sendmail.call_args.args
+        assert (sender, rcpts) == ("sender@gmail.com", ["to@test.com"])
+        assert b"To: to@test.com\r\n" in raw
+
+    def test_connection_reused_across_recipients(self):
+        with patch("src.delivery.gmail.GMAIL_SENDER_EMAIL", "sender@gmail.com"), \
+             patch("src.delivery.gmail.GMAIL_APP_PASSWORD", "pass"), \
+             patch("src.delivery.gmail.smtplib.SMTP_SSL") as mock_ssl:
+            for to in ("a@test.com", "b@test.com", "c@test.com"):
+                send_smtp(to, "Subject", "<p>Hi</p>")
+            close_smtp()
+
+        assert mock_ssl.call_count == 1
+        mock_ssl.return_value.login.assert_called_once()
+        assert mock_ssl.return_value.sendmail.call_count == 3
+        mock_ssl.return_value.quit.assert_called_once()
+
+    def test_reconnects_once_when_server_disconnects(self):
+        stale, fresh = MagicMock(), MagicMock()
+        stale.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+        with patch("src.delivery.gmail.GMAIL_SENDER_EMAIL", "sender@gmail.com"), \
+             patch("src.delivery.gmail.GMAIL_APP_PASSWORD", "pass"), \
+             patch("src.delivery.gmail.smtplib.SMTP_SSL", side_effect=[stale, fresh]):
+            result = send_smtp("to@test.com", "Subject", "<p>Hi</p>")
+
+        assert result["status"] == "sent"
+        fresh.sendmail.assert_called_once()
 
     def test_send_smtp_missing_password_raises(self):
         """Should raise RuntimeError if GMAIL_APP_PASSWORD is not set."""
@@ -99,9 +204,7 @@ class TestSmtpDelivery:
              patch("src.delivery.gmail.GMAIL_SENDER_EMAIL", "s@g.com"), \
              patch("src.delivery.gmail.GMAIL_APP_PASSWORD", "pass"), \
              patch("src.delivery.gmail.smtplib.SMTP_SSL") as mock_ssl:
-            mock_server = MagicMock()
-            mock_ssl.return_value.__enter__ = MagicMock(return_value=mock_server)
-            mock_ssl.return_value.__exit__ = MagicMock(return_value=False)
+            mock_server = mock_ssl.return_value
 
             result = send_email("to@test.com", "Subject", "<p>Hi</p>")
 
@@ -141,6 +244,20 @@ class TestGmailDelivery:
         assert result["gmail_message_id"] == "msg-123abc"
         assert result["recipient"] == "to@test.com"
 
+    def test_service_built_once_with_persistent_transport(self):
+        from src.delivery.gmail import _get_gmail_service
+
+        with patch("src.delivery.auth.get_credentials", return_value=MagicMock()), \
+             patch("googleapiclient.discovery.build") as build:
+            first = _get_gmail_service()
+            assert _get_gmail_service() is first
+
+        build.assert_called_once()
+        kwargs = build.call_args.kwargs
+        assert kwargs["static_discovery"] is True
+        assert "credentials" not in kwargs
+        assert kwargs["http"] is not None
+
     def test_send_email_mock_mode(self, tmp_path):
         """send_email in mock mode should write a file."""
         with patch("src.delivery.gmail.DELIVERY_MODE", "mock"), \
@@ -196,22 +313,449 @@ class TestGmailDelivery:
         assert "Permanent error" in result["error"]
 
 
+class TestGmailBatch:
+    def setup_method(self):
+        reset_service()
+
+    def _service(self, fail: set[str] = frozenset(), error: Exception | None = None):
+        """Mock service whose batch requests report per-recipient outcomes."""
+        service = MagicMock()
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda req, request_id: added.append(request_id)
+
+            def execute():
+                for rid in added:
+                    if rid in fail:
+                        callback(rid, None, error or Exception("quota"))
+                    else:
+                        callback(rid, {"id": f"msg-{rid}"}, None)
+
+            batch.execute.side_effect = execute
+            batches.append(batch)
+            return batch
+
+        service.new_batch_http_request.side_effect = new_batch
+        return service, batches
+
+    def test_batches_requests_in_chunks(self):
+        service, batches = self._service()
+        messages = [(f"user{i}@test.com", "Subject", "<p>Hi</p>") for i in range(5)]
+        with patch("src.delivery.gmail._get_gmail_service", return_value=service), \
+             patch("src.delivery.gmail.GMAIL_BATCH_SIZE", 2):
+            results = send_gmail_batch(messages)
+
+        assert len(batches) == 3
+        assert [r["gmail_message_id"] for r in results] == [f"msg-{i}" for i in range(5)]
+        assert [r["recipient"] for r in results] == [m[0] for m in messages]
+
+    def test_send_email_many_retries_failed_individually(self):
+        service, _ = self._service(fail={"1"})
+        service.users().messages().send.return_value.execute.return_value = {"id": "msg-retry"}
+        messages = [("a@test.com", "S", "<p/>"), ("b@test.com", "S", "<p/>")]
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail._get_gmail_service", return_value=service):
+            results = send_email_many(messages)
+
+        assert [r["status"] for r in results] == ["sent", "sent"]
+        assert results[0]["gmail_message_id"] == "msg-0"
+        assert results[1]["gmail_message_id"] == "msg-retry"
+
+    def test_send_email_many_dead_letters_permanent_batch_failures(self, tmp_path):
+        error = Exception("Invalid To header")
+        error.resp = MagicMock(status=400)
+        service, _ = self._service(fail={"1"}, error=error)
+        messages = [("a@test.com", "S", "<p/>"), ("bad@test.com", "S", "<p/>")]
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail._get_gmail_service", return_value=service), \
+             patch("src.delivery.gmail.send_email") as send:
+            results = send_email_many(messages)
+
+        send.assert_not_called()
+        assert results[1]["status"] == "failed"
+        assert results[1]["retryable"] is False
+        assert list((tmp_path / "output" / DEAD_LETTER_DIR).glob("digest_bad_at_test_com-*.error.json"))
+
+    def test_send_email_many_smtp_connection_per_thread(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def new_server(*args):
+            server = MagicMock()
+            # Hold both workers until each has its own connection
+            server.sendmail.side_effect = lambda *args: barrier.wait()
+            return server
+
+        messages = [("a@test.com", "S", "<p/>"), ("b@test.com", "S", "<p/>")]
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.GMAIL_SENDER_EMAIL", "s@g.com"), \
+             patch("src.delivery.gmail.GMAIL_APP_PASSWORD", "pass"), \
+             patch("src.delivery.gmail.smtplib.SMTP_SSL", side_effect=new_server) as mock_ssl:
+            results = send_email_many(messages, max_workers=2)
+            close_smtp()
+
+        assert [r["recipient"] for r in results] == ["a@test.com", "b@test.com"]
+        assert all(r["status"] == "sent" for r in results)
+        assert mock_ssl.call_count == 2
+
+    def test_send_email_many_mock_mode(self, tmp_path):
+        messages = [("a@test.com", "S", "<p/>"), ("b@test.com", "S", "<p/>")]
+        with patch("src.delivery.gmail.DELIVERY_MODE", "mock"), \
+             patch("src.delivery.gmail.MOCK_OUTPUT_DIR", tmp_path):
+            results = send_email_many(messages)
+        assert [r["mode"] for r in results] == ["mock", "mock"]
+
+
+class TestRetryPolicy:
+    def test_backoff_is_full_jitter_and_capped(self):
+        mock_service = MagicMock()
+        mock_service.users().messages().send.return_value.execute.side_effect = Exception("503")
+
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail._get_gmail_service", return_value=mock_service), \
+             patch("time.sleep") as sleep:
+            send_email("to@test.com", "Subject", "<p>Hi</p>", max_retries=6)
+
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert len(waits) == 5
+        assert all(0 <= w <= min(2 ** i, 30) for i, w in enumerate(waits))
+
+    def test_auth_rejection_not_retried(self):
+        error = smtplib.SMTPAuthenticationError(535, b"Bad credentials")
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp", side_effect=error) as send, \
+             patch("time.sleep") as sleep:
+            result = send_email("to@test.com", "Subject", "<p>Hi</p>")
+
+        assert result["status"] == "failed"
+        assert send.call_count == 1
+        sleep.assert_not_called()
+
+    def test_refused_recipient_not_retried(self):
+        error = smtplib.SMTPRecipientsRefused({"x@y.com": (550, b"No such user")})
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp", side_effect=error) as send, \
+             patch("time.sleep"):
+            send_email("x@y.com", "Subject", "<p>Hi</p>")
+        assert send.call_count == 1
+
+    def test_http_429_is_retried(self):
+        error = Exception("rate limited")
+        error.resp = MagicMock(status=429)
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail.send_gmail", side_effect=error) as send, \
+             patch("time.sleep"):
+            send_email("to@test.com", "Subject", "<p>Hi</p>", max_retries=3)
+        assert send.call_count == 3
+
+    def test_http_403_not_retried(self):
+        error = Exception("forbidden")
+        error.resp = MagicMock(status=403)
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail.send_gmail", side_effect=error) as send, \
+             patch("time.sleep"):
+            result = send_email("to@test.com", "Subject", "<p>Hi</p>")
+
+        assert result["status"] == "failed"
+        assert send.call_count == 1
+
+
+class TestDeadLetter:
+    def _fail(self, error, **kwargs):
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp", side_effect=error), \
+             patch("time.sleep"):
+            return send_email("x@y.com", "Subject", "<p>Hi</p>", max_retries=2, **kwargs)
+
+    def test_exhausted_retries_are_dead_lettered(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("gone"))
+        [meta_path] = (tmp_path / "output" / DEAD_LETTER_DIR).glob("digest_x_at_y_com-*.error.json")
+        meta = json.loads(meta_path.read_text())
+        assert meta["recipient"] == "x@y.com"
+        assert meta["subject"] == "Subject"
+        assert meta["attempts"] == 2
+        assert meta["last_error"] == "gone"
+        html_path = meta_path.with_name(meta_path.name.removesuffix(".error.json") + ".html")
+        assert html_path.read_text() == "<p>Hi</p>"
+
+    def test_repeat_failures_keep_separate_files(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("first"))
+        self._fail(smtplib.SMTPServerDisconnected("second"))
+        failed = tmp_path / "output" / DEAD_LETTER_DIR
+        errors = sorted(json.loads(p.read_text())["last_error"] for p in failed.glob("*.error.json"))
+        assert errors == ["first", "second"]
+        assert len(list(failed.glob("*.html"))) == 2
+
+    def test_queued_transient_failure_not_dead_lettered(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("gone"), dead_letter=False)
+        assert not (tmp_path / "output" / DEAD_LETTER_DIR).exists()
+
+    def test_permanent_failure_always_dead_lettered(self, tmp_path):
+        error = smtplib.SMTPRecipientsRefused({"x@y.com": (550, b"No such user")})
+        self._fail(error, dead_letter=False)
+        assert list((tmp_path / "output" / DEAD_LETTER_DIR).glob("digest_x_at_y_com-*.error.json"))
+
+    def test_replay_removes_delivered_messages(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("gone"))
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp",
+                   return_value={"status": "sent", "mode": "smtp"}) as send:
+            results = replay_failed()
+
+        send.assert_called_once_with("x@y.com", "Subject", "<p>Hi</p>")
+        assert [r["status"] for r in results] == ["sent"]
+        assert not list((tmp_path / "output" / DEAD_LETTER_DIR).iterdir())
+
+    def test_replay_keeps_dead_letter_on_mock_fallback(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("gone"))
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp", side_effect=RuntimeError("SMTP auth missing")):
+            [result] = replay_failed()
+
+        assert result["mode"] == "mock"
+        failed = tmp_path / "output" / DEAD_LETTER_DIR
+        assert len(list(failed.glob("*.error.json"))) == 1
+        assert len(list(failed.glob("*.html"))) == 1
+
+    def test_replay_failure_replaces_dead_letter(self, tmp_path):
+        self._fail(smtplib.SMTPServerDisconnected("gone"))
+        with patch("src.delivery.gmail.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.gmail.send_smtp", side_effect=smtplib.SMTPServerDisconnected("again")), \
+             patch("time.sleep"):
+            replay_failed(max_retries=1)
+
+        [meta_path] = (tmp_path / "output" / DEAD_LETTER_DIR).glob("*.error.json")
+        assert json.loads(meta_path.read_text())["last_error"] == "again"
+
+
+class TestDeliveryQueue:
+    @pytest.fixture
+    def conn(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        init_db(db_path)
+        conn = get_connection(db_path)
+        yield conn
+        conn.close()
+
+    def _queue_rows(self, conn):
+        return [dict(r) for r in conn.execute("SELECT * FROM delivery_queue ORDER BY id")]
+
+    def test_retryable_failures_are_queued(self, conn, tmp_path):
+        results = [
+            {"status": "sent", "recipient": "a@test.com"},
+            {"status": "failed", "recipient": "b@test.com", "error": "503", "retryable": True},
+            {"status": "failed", "recipient": "c@test.com", "error": "550", "retryable": False},
+        ]
+        queued = queue_failed_sends(conn, results, "Subject", "<p>Digest</p>", run_id=7)
+
+        assert [r["status"] for r in queued] == ["sent", "queued", "failed"]
+        rows = self._queue_rows(conn)
+        assert [r["recipient_email"] for r in rows] == ["b@test.com"]
+        assert rows[0]["status"] == "pending"
+        assert rows[0]["attempts"] == 1
+        # Queued rows point at a per-run copy, not the weekly digest file
+        snapshot = Path(rows[0]["html_path"])
+        assert snapshot.name == "digest-run7.html"
+        assert snapshot.read_text(encoding="utf-8") == "<p>Digest</p>"
+
+    def test_pipeline_retries_in_process_by_default(self, conn):
+        recipients = {"recipients": [{"email": "a@test.com", "status": "active"}]}
+        failure = {"status": "failed", "recipient": "a@test.com", "retryable": True}
+        with patch("src.pipeline.get_recipients", return_value=recipients), \
+             patch("src.pipeline.send_email_many", return_value=[failure]) as send:
+            results = stage_deliver("<p>Digest</p>", "Subject", conn, run_id=1)
+
+        assert send.call_args.kwargs["max_retries"] == 3
+        assert results[0]["status"] == "failed"
+        assert self._queue_rows(conn) == []
+
+    def test_pipeline_queue_mode_drains_due_rows_first(self, conn):
+        recipients = {"recipients": [{"email": "a@test.com", "status": "active"}]}
+        failure = {"status": "failed", "recipient": "a@test.com", "retryable": True}
+        with patch("src.pipeline.DELIVERY_QUEUE", True), \
+             patch("src.pipeline.get_recipients", return_value=recipients), \
+             patch("src.pipeline.process_due_deliveries") as drain, \
+             patch("src.pipeline.send_email_many", return_value=[failure]) as send:
+            results = stage_deliver("<p>Digest</p>", "Subject", conn, run_id=1)
+
+        drain.assert_called_once_with(conn)
+        assert send.call_args.kwargs["max_retries"] == 1
+        assert results[0]["status"] == "queued"
+
+    def test_send_email_marks_transient_failures_retryable(self):
+        error = Exception("unavailable")
+        error.resp = MagicMock(status=503)
+        with patch("src.delivery.gmail.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.gmail.send_gmail", side_effect=error), \
+             patch("time.sleep") as sleep:
+            result = send_email("to@test.com", "Subject", "<p>Hi</p>", max_retries=1)
+        assert result["retryable"] is True
+        sleep.assert_not_called()
+
+    def test_worker_sends_due_rows(self, conn, tmp_path):
+        html_path = tmp_path / "digest.html"
+        html_path.write_text("<p>Digest</p>", encoding="utf-8")
+        enqueue_delivery(conn, "due@test.com", "Subject", html_path, 0)
+        enqueue_delivery(conn, "later@test.com", "Subject", html_path, 3600)
+
+        with patch("src.delivery.worker.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.worker.send_email",
+                   return_value={"status": "sent", "mode": "smtp"}) as send:
+            assert process_due_deliveries(conn) == 1
+
+        send.assert_called_once_with(
+            "due@test.com", "Subject", "<p>Digest</p>", max_retries=1, dead_letter=False
+        )
+        assert [r["status"] for r in self._queue_rows(conn)] == ["sent", "pending"]
+
+    def test_worker_reschedules_then_gives_up(self, conn, tmp_path):
+        html_path = tmp_path / "digest.html"
+        html_path.write_text("<p>Digest</p>", encoding="utf-8")
+        enqueue_delivery(conn, "to@test.com", "Subject", html_path, 0, attempts=QUEUE_MAX_ATTEMPTS - 2)
+        failure = {"status": "failed", "error": "503", "retryable": True}
+
+        with patch("src.delivery.worker.send_email", return_value=failure), \
+             patch("src.delivery.worker.queue_backoff", return_value=0):
+            process_due_deliveries(conn)
+            assert self._queue_rows(conn)[0]["status"] == "pending"
+            process_due_deliveries(conn)
+
+        row = self._queue_rows(conn)[0]
+        assert row["status"] == "failed"
+        assert row["attempts"] == QUEUE_MAX_ATTEMPTS
+        assert row["last_error"] == "503"
+
+    def test_concurrent_drains_send_each_row_once(self, conn, tmp_path):
+        html_path = tmp_path / "digest.html"
+        html_path.write_text("<p>Digest</p>", encoding="utf-8")
+        recipients = [f"r{i}@test.com" for i in range(20)]
+        for recipient in recipients:
+            enqueue_delivery(conn, recipient, "Subject", html_path, 0)
+
+        sent, lock = [], threading.Lock()
+
+        def slow_send(to, *args, **kwargs):
+            with lock:
+                sent.append(to)
+            time.sleep(0.005)
+            return {"status": "sent", "mode": "smtp"}
+
+        def drain():
+            worker_conn = get_connection(tmp_path / "test.db")
+            try:
+                process_due_deliveries(worker_conn)
+            finally:
+                worker_conn.close()
+
+        with patch("src.delivery.worker.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.worker.send_email", side_effect=slow_send):
+            threads = [threading.Thread(target=drain) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(sent) == sorted(recipients)
+        assert {r["status"] for r in self._queue_rows(conn)} == {"sent"}
+
+    def test_stale_claim_is_retried(self, conn, tmp_path):
+        html_path = tmp_path / "digest.html"
+        html_path.write_text("<p>Digest</p>", encoding="utf-8")
+        queue_id = enqueue_delivery(conn, "to@test.com", "Subject", html_path, 0)
+        # Claimed by a worker that crashed before recording the outcome
+        conn.execute(
+            "UPDATE delivery_queue SET status = 'sending', next_retry_at = datetime('now', '-1 seconds')"
+            " WHERE id = ?", (queue_id,),
+        )
+
+        with patch("src.delivery.worker.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.worker.send_email",
+                   return_value={"status": "sent", "mode": "smtp"}):
+            assert process_due_deliveries(conn) == 1
+        assert self._queue_rows(conn)[0]["status"] == "sent"
+
+    def test_mock_fallback_is_not_delivery(self, conn, tmp_path):
+        html_path = tmp_path / "digest.html"
+        html_path.write_text("<p>Digest</p>", encoding="utf-8")
+        enqueue_delivery(conn, "to@test.com", "Subject", html_path, 0)
+
+        with patch("src.delivery.worker.DELIVERY_MODE", "gmail"), \
+             patch("src.delivery.worker.send_email",
+                   return_value={"status": "sent", "mode": "mock"}):
+            process_due_deliveries(conn)
+
+        row = self._queue_rows(conn)[0]
+        assert row["status"] == "pending"
+        assert row["attempts"] == 2
+
+    def test_snapshot_removed_when_run_is_done(self, conn):
+        failure = {"status": "failed", "recipient": "a@test.com", "retryable": True}
+        queue_failed_sends(conn, [failure], "Subject", "<p>Digest</p>", run_id=3)
+        snapshot = Path(self._queue_rows(conn)[0]["html_path"])
+        conn.execute("UPDATE delivery_queue SET next_retry_at = datetime('now')")
+
+        with patch("src.delivery.worker.DELIVERY_MODE", "smtp"), \
+             patch("src.delivery.worker.send_email",
+                   return_value={"status": "sent", "mode": "smtp"}):
+            process_due_deliveries(conn)
+        assert not snapshot.exists()
+
+
 # -- Auth status tests --
 
 
 class TestAuthStatus:
+    def setup_method(self):
+        reset_credentials()
+
+    def teardown_method(self):
+        reset_credentials()
+
     def test_status_no_credentials(self, tmp_path):
         with patch("src.delivery.auth.CREDENTIALS_PATH", tmp_path / "nonexistent.json"):
             status = check_auth_status()
         assert not status["authorized"]
         assert "credentials.json" in status["message"]
 
+    def test_env_credentials_written_once(self, tmp_path):
+        from src.delivery.auth import _resolve_credentials_path
+
+        creds_path = tmp_path / "credentials.json"
+        with patch.dict(os.environ, {"GMAIL_CREDENTIALS_JSON": '{"installed": {}}'}), \
+             patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch.object(Path, "write_text", autospec=True,
+                          side_effect=Path.write_text) as write:
+            assert _resolve_credentials_path() == creds_path
+            assert _resolve_credentials_path() == creds_path
+        assert write.call_count == 1
+        assert json.loads(creds_path.read_text()) == {"installed": {}}
+
+    def test_env_credentials_restored_after_delete(self, tmp_path):
+        from src.delivery.auth import _resolve_credentials_path
+
+        creds_path = tmp_path / "credentials.json"
+        with patch.dict(os.environ, {"GMAIL_CREDENTIALS_JSON": '{"installed": {}}'}), \
+             patch("src.delivery.auth.CREDENTIALS_PATH", creds_path):
+            _resolve_credentials_path()
+            creds_path.unlink()
+            _resolve_credentials_path()
+        assert json.loads(creds_path.read_text()) == {"installed": {}}
+
+    def test_env_credentials_must_be_json_object(self, tmp_path):
+        with patch.dict(os.environ, {"GMAIL_CREDENTIALS_JSON": "config/credentials.json"}), \
+             patch("src.delivery.auth.CREDENTIALS_PATH", tmp_path / "credentials.json"):
+            status = check_auth_status()
+        assert not status["authorized"]
+        assert "JSON object" in status["message"]
+
     def test_status_not_authorized(self, tmp_path):
         creds_path = tmp_path / "credentials.json"
         creds_path.write_text("{}")
         with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
              patch("src.delivery.auth.get_credentials", return_value=None):
-            status = check_auth_status()
+            status = check_auth_status(deep=True)
         assert not status["authorized"]
 
     def test_status_authorized(self, tmp_path):
@@ -220,5 +764,111 @@ class TestAuthStatus:
         mock_creds = MagicMock()
         with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
              patch("src.delivery.auth.get_credentials", return_value=mock_creds):
+            status = check_auth_status(deep=True)
+        assert status["authorized"]
+
+    def test_shallow_status_only_checks_files(self, tmp_path):
+        creds_path = tmp_path / "credentials.json"
+        creds_path.write_text("{}")
+        token_path = tmp_path / "token.json"
+        token_path.write_text("{}")
+        with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch("src.delivery.auth.TOKEN_PATH", token_path), \
+             patch("src.delivery.auth.get_credentials") as get_creds:
             status = check_auth_status()
         assert status["authorized"]
+        get_creds.assert_not_called()
+
+    def test_status_cached_within_ttl(self, tmp_path):
+        creds_path = tmp_path / "credentials.json"
+        creds_path.write_text("{}")
+        with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch("src.delivery.auth.get_credentials", return_value=MagicMock()) as get_creds:
+            check_auth_status(deep=True)
+            check_auth_status(deep=True)
+            with patch("src.delivery.auth.AUTH_STATUS_TTL", 0):
+                check_auth_status(deep=True)
+        assert get_creds.call_count == 2
+
+
+    def test_auth_flow_clears_cached_status(self, tmp_path):
+        creds_path = tmp_path / "credentials.json"
+        creds_path.write_text("{}")
+        with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch("src.delivery.auth.TOKEN_PATH", tmp_path / "token.json"), \
+             patch("src.delivery.auth.get_credentials", return_value=None):
+            assert not check_auth_status(deep=True)["authorized"]
+
+        with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch("src.delivery.auth.TOKEN_PATH", tmp_path / "token.json"), \
+             patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file") as flow, \
+             patch("src.delivery.auth._save_token"), \
+             patch("builtins.print"):
+            run_auth_flow()
+            assert flow.return_value.run_local_server.called
+
+        with patch("src.delivery.auth.CREDENTIALS_PATH", creds_path), \
+             patch("src.delivery.auth.get_credentials", return_value=MagicMock()):
+            assert check_auth_status(deep=True)["authorized"]
+
+
+class TestCredentialsCache:
+    def setup_method(self):
+        reset_credentials()
+
+    def teardown_method(self):
+        reset_credentials()
+
+    def test_token_parsed_once_while_unchanged(self, tmp_path):
+        token_path = tmp_path / "token.json"
+        token_path.write_text("{}")
+        creds = MagicMock(valid=True)
+        with patch("src.delivery.auth.TOKEN_PATH", token_path), \
+             patch("src.delivery.auth.Credentials.from_authorized_user_file",
+                   return_value=creds) as load:
+            assert get_credentials() is creds
+            assert get_credentials() is creds
+        assert load.call_count == 1
+
+    def test_token_reparsed_after_file_changes(self, tmp_path):
+        token_path = tmp_path / "token.json"
+        token_path.write_text("{}")
+        with patch("src.delivery.auth.TOKEN_PATH", token_path), \
+             patch("src.delivery.auth.Credentials.from_authorized_user_file",
+                   side_effect=[MagicMock(valid=True), MagicMock(valid=True)]) as load:
+            first = get_credentials()
+            os.utime(token_path, ns=(0, token_path.stat().st_mtime_ns + 1_000_000))
+            assert get_credentials() is not first
+        assert load.call_count == 2
+
+    def test_service_reset_keeps_credentials_unless_asked(self, tmp_path):
+        token_path = tmp_path / "token.json"
+        token_path.write_text("{}")
+        with patch("src.delivery.auth.TOKEN_PATH", token_path), \
+             patch("src.delivery.auth.Credentials.from_authorized_user_file",
+                   side_effect=lambda *a: MagicMock(valid=True)) as load:
+            get_credentials()
+            reset_service()
+            get_credentials()
+            assert load.call_count == 1
+            reset_service(reset_creds=True)
+            get_credentials()
+        assert load.call_count == 2
+
+    def test_save_token_replaces_file_atomically(self, tmp_path):
+        token_path = tmp_path / "token.json"
+        token_path.write_text("old")
+        creds = MagicMock(
+            token="t", refresh_token="r", token_uri="u",
+            client_id="c", client_secret="s", scopes=["scope"],
+        )
+        with patch("src.delivery.auth.TOKEN_PATH", token_path):
+            _save_token(creds)
+
+        assert json.loads(token_path.read_text())["refresh_token"] == "r"
+        assert token_path.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [token_path]
+
+    def test_missing_token_returns_none(self, tmp_path):
+        with patch("src.delivery.auth.TOKEN_PATH", tmp_path / "token.json"):
+            assert get_credentials() is None